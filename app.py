@@ -12,31 +12,59 @@ import json
 import tempfile
 import shutil
 import zipfile
+import re
+import time
+import uuid
+import queue
+import threading
+import multiprocessing
 from pathlib import Path
 from datetime import datetime
-from functools import wraps
+from collections import Counter
+from functools import wraps, lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
-from flask import Flask, render_template, request, jsonify, send_file, redirect, url_for, flash
+from flask import (
+    Flask, Response, render_template, request, jsonify, send_file, redirect, url_for, flash,
+    stream_with_context
+)
 from werkzeug.utils import secure_filename
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Kendi modülümüzü import et
 from dosya_analiz import (
     analyze_excel, analyze_word, analyze_pdf,
     build_tree, categorize_files, generate_folder_report,
-    generate_master_report, format_size,
-    HAS_OPENPYXL, HAS_DOCX, HAS_PDF, HAS_XLRD,
+    format_size, walk_tree, get_extension, get_file_category,
+    clear_analysis_cache, clear_scan_cache, create_executor, submit_analyses, collect_analyses,
+    analyze_one, relative_path,
+    HAS_OPENPYXL, HAS_DOCX, HAS_PDF, HAS_XLRD, HAS_CALAMINE, HAS_FITZ,
     EXCEL_EXTENSIONS, EXCEL_OLD_EXTENSIONS, WORD_EXTENSIONS, PDF_EXTENSIONS,
-    RAPOR_KLASOR_ADI, RAPOR_DOSYA_ADI, IGNORED_DIRS
+    WORD_AKIS_ESIGI, RAPOR_YAZMA_TAMPONU
 )
 
 # ─── Flask Uygulaması ─────────────────────────────────────────────────────────
 app = Flask(__name__)
 app.secret_key = os.environ.get('SECRET_KEY', 'dosya-analiz-secret-key-2024')
 app.config['MAX_CONTENT_LENGTH'] = 500 * 1024 * 1024  # 500 MB max upload
-app.config['UPLOAD_FOLDER'] = tempfile.mkdtemp(prefix='dosya_analiz_')
+app.config['UPLOAD_FOLDER'] = None  # İlk istekte oluşturulur (bkz. init_storage)
+UPLOAD_CHUNK_SIZE = 1 << 20  # Yüklemeleri diske 1 MiB'lık bloklarla yaz
+ZIP_MAX_ACIK_BOYUT = 2 * 10**9  # ZIP'ten çıkarılabilecek toplam boyut (2 GB)
+ZIP_MAX_SIKISTIRMA_ORANI = 100  # Bu oranın üzerinde sıkıştırılmış büyük üyeler reddedilir
+GECICI_HAVUZ_BOYUTU = 16  # Önceden oluşturulmuş boş geçici klasör sayısı
+COP_KLASORU = None  # Silinmeyi bekleyen klasörler (UPLOAD_FOLDER/.cop)
+RAPOR_ARSIVI = None  # İndirilebilir raporlar (UPLOAD_FOLDER/.raporlar)
+RAPOR_OMRU_SANIYE = 60 * 60  # İndirilebilir raporların saklanma süresi
+# Web arayüzünde analiz önbelleği yalnızca DOSYA_ANALIZ_CACHE açıkça verilmişse kullanılır
+WEB_ONBELLEK = bool(os.environ.get('DOSYA_ANALIZ_CACHE'))
 
 # İzin verilen dosya uzantıları
-ALLOWED_EXTENSIONS = (
+ALLOWED_EXTENSIONS = frozenset(
     EXCEL_EXTENSIONS | EXCEL_OLD_EXTENSIONS | 
     WORD_EXTENSIONS | PDF_EXTENSIONS | 
     {'.zip', '.tar', '.gz'}
@@ -45,34 +73,260 @@ ALLOWED_EXTENSIONS = (
 
 def allowed_file(filename):
     """Dosya uzantısının izin verilip verilmediğini kontrol eder."""
-    return '.' in filename and Path(filename).suffix.lower() in ALLOWED_EXTENSIONS
+    return get_extension(filename) in ALLOWED_EXTENSIONS
+
+
+def _json_bytes(data):
+    """Veriyi JSON byte dizisine çevirir (orjson varsa onunla)."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+
+def ojsonify(data):
+    """Büyük analiz sonuçları için hızlı JSON yanıtı oluşturur."""
+    if HAS_ORJSON:
+        return Response(_json_bytes(data), mimetype='application/json')
+    return jsonify(data)
+
+
+def save_upload(file, path, size_hint=None):
+    """Yüklenen dosyayı büyük bloklarla diske yazar.
+
+    `size_hint` verilirse dosyanın yeri önceden ayrılır (parçalanmayı azaltır);
+    yazım bitince dosya gerçek boyutuna kısaltılır.
+    """
+    fd = os.open(path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o600)
+    with open(fd, 'wb', buffering=UPLOAD_CHUNK_SIZE) as out:
+        if size_hint and hasattr(os, 'posix_fallocate'):
+            try:
+                os.posix_fallocate(fd, 0, size_hint)
+            except OSError:
+                pass  # Dosya sistemi desteklemiyorsa normal yazıma devam et
+        shutil.copyfileobj(file.stream, out, UPLOAD_CHUNK_SIZE)
+        out.truncate()
+
+
+def _zip_member_path(extract_dir, member_name):
+    """ZIP üyesinin çıkarılacağı güvenli hedef yolu döndürür (zipfile ile aynı kurallar)."""
+    arcname = member_name.replace('/', os.path.sep)
+    if os.path.altsep:
+        arcname = arcname.replace(os.path.altsep, os.path.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+    parts = [p for p in arcname.split(os.path.sep) if p not in ('', os.path.curdir, os.path.pardir)]
+    return os.path.normpath(os.path.join(extract_dir, *parts))
+
+
+def check_zip_budget(zip_ref, extract_dir):
+    """ZIP'in merkezi dizinine bakarak çıkarma öncesi boyut kontrolü yapar.
+
+    Sorun varsa hata mesajı, yoksa None döndürür.
+    """
+    total = 0
+    for zi in zip_ref.infolist():
+        total += zi.file_size
+        # Küçük dosyalar doğal olarak yüksek oranla sıkışabilir; yalnızca büyükleri denetle
+        if zi.file_size > UPLOAD_CHUNK_SIZE and zi.file_size > zi.compress_size * ZIP_MAX_SIKISTIRMA_ORANI:
+            return f'ZIP içindeki dosyanın sıkıştırma oranı çok yüksek: {zi.filename}'
+    
+    if total > ZIP_MAX_ACIK_BOYUT:
+        return f'ZIP içeriği çok büyük ({format_size(total)}, maksimum {format_size(ZIP_MAX_ACIK_BOYUT)})'
+    
+    if total > shutil.disk_usage(os.path.dirname(extract_dir)).free:
+        return 'ZIP içeriğini çıkarmak için yeterli disk alanı yok'
+    
+    return None
+
+
+def extract_zip(zip_ref, extract_dir):
+    """ZIP arşivini iş parçacığı havuzu ile paralel olarak çıkarır."""
+    members = zip_ref.infolist()
+    
+    # Klasör iskeletini tek seferde oluştur (iş parçacıkları makedirs için yarışmasın)
+    dirs = {extract_dir}
+    for zi in members:
+        target = _zip_member_path(extract_dir, zi.filename)
+        dirs.add(target if zi.is_dir() else os.path.dirname(target))
+    for d in dirs:
+        os.makedirs(d, exist_ok=True)
+    
+    # Dosyaları paralel çıkar (zlib açma işlemi GIL'i serbest bırakır)
+    file_members = [zi for zi in members if not zi.is_dir()]
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as ex:
+        list(ex.map(lambda zi: zip_ref.extract(zi, extract_dir), file_members))
+
+
+def acquire_temp_dir():
+    """Havuzdan boş bir geçici klasör alır; havuz boşsa yenisini oluşturur."""
+    try:
+        return _temp_pool.get_nowait()
+    except queue.Empty:
+        return tempfile.mkdtemp(dir=app.config['UPLOAD_FOLDER'])
 
 
 def cleanup_temp_folder(folder_path):
-    """Geçici klasörü temizler."""
+    """Geçici klasörü çöp klasörüne taşır; silme işlemi arka planda yapılır.
+
+    Taşıma başarısız olursa klasör sızmasın diye hemen (istek içinde) silinir.
+    """
+    trash = os.path.join(COP_KLASORU, os.path.basename(folder_path))
+    try:
+        os.rename(folder_path, trash)
+    except OSError as e:
+        app.logger.warning('Geçici klasör çöpe taşınamadı, doğrudan siliniyor: %s (%s)', folder_path, e)
+        shutil.rmtree(folder_path, ignore_errors=True)
+        return
+    _cleanup_queue.put(trash)
+
+
+def save_report(result):
+    """Analiz sonucunu indirilebilir Markdown rapor olarak diske yazar ve kimliğini döndürür.
+
+    Rapor /download ile sendfile üzerinden sunulur ve RAPOR_OMRU_SANIYE sonra silinir.
+    Yazılamazsa None döner.
+    """
+    # Parçalar tek bir metinde birleştirilmeden sırayla dosyaya yazılır
+    if result.get('main_report') is not None:
+        parts = [
+            f"# {result.get('name') or 'Proje'} Analiz Raporu\n\n",
+            f"## Klasör Yapısı\n```\n{result.get('tree', '')}\n```\n\n",
+            result['main_report'],
+        ]
+        parts.extend(f"\n\n---\n\n{folder['report']}" for folder in result.get('folder_reports', []))
+        filename = f"{result.get('name') or 'proje'}_analiz_raporu.md"
+    else:
+        parts = [
+            f"# {result.get('filename') or 'Dosya'} Analizi\n\n",
+            f"- **Boyut:** {result.get('size')}\n",
+            f"- **Tür:** {result.get('type')}\n\n",
+            result.get('analysis') or '',
+        ]
+        filename = f"{result.get('filename') or 'dosya'}_analizi.md"
+    
+    report_id = uuid.uuid4().hex
+    report_dir = os.path.join(RAPOR_ARSIVI, report_id)
     try:
-        if Path(folder_path).exists():
-            shutil.rmtree(folder_path)
-    except Exception:
-        pass
+        os.makedirs(report_dir)
+        with open(os.path.join(report_dir, secure_filename(filename) or 'analiz_raporu.md'), 'w',
+                  encoding='utf-8', buffering=RAPOR_YAZMA_TAMPONU) as f:
+            f.writelines(parts)
+    except OSError:
+        # Rapor yazılamazsa (ör. disk dolu) analiz yine döner; arayüz raporu kendisi oluşturur
+        shutil.rmtree(report_dir, ignore_errors=True)
+        return None
+    return report_id
+
+
+def _prune_reports():
+    """Saklanma süresi dolan indirilebilir raporları siler."""
+    limit = time.time() - RAPOR_OMRU_SANIYE
+    try:
+        with os.scandir(RAPOR_ARSIVI) as it:
+            expired = [entry.path for entry in it if entry.stat().st_mtime < limit]
+    except OSError:
+        return
+    for path in expired:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def _cleanup_worker():
+    """Çöpe atılan klasörleri siler, geçici klasör havuzunu doldurur ve eski raporları temizler."""
+    last_prune = time.monotonic()
+    while True:
+        try:
+            path = _cleanup_queue.get(timeout=60)
+        except queue.Empty:
+            path = None
+        
+        if path:
+            shutil.rmtree(path, ignore_errors=True)
+            try:
+                while _temp_pool.qsize() < GECICI_HAVUZ_BOYUTU:
+                    _temp_pool.put(tempfile.mkdtemp(dir=app.config['UPLOAD_FOLDER']))
+            except OSError:
+                pass
+        
+        if time.monotonic() - last_prune >= 60:
+            _prune_reports()
+            last_prune = time.monotonic()
+
+
+_temp_pool = queue.Queue()
+_cleanup_queue = queue.Queue()
+_init_lock = threading.Lock()
+
+
+def init_storage():
+    """Yükleme klasörünü, geçici klasör havuzunu ve temizlik iş parçacığını bir kez hazırlar.
+
+    Modül içe aktarılırken değil ilk istekte çağrılır; böylece modülü yeniden içe aktaran
+    süreçler (ör. 'spawn' ile başlayan havuz işçileri) klasör ve iş parçacığı oluşturmaz.
+    """
+    global COP_KLASORU, RAPOR_ARSIVI
+    with _init_lock:
+        if app.config['UPLOAD_FOLDER']:
+            return
+        upload_folder = tempfile.mkdtemp(prefix='dosya_analiz_')
+        COP_KLASORU = os.path.join(upload_folder, '.cop')
+        RAPOR_ARSIVI = os.path.join(upload_folder, '.raporlar')
+        os.makedirs(COP_KLASORU, exist_ok=True)
+        os.makedirs(RAPOR_ARSIVI, exist_ok=True)
+        for _ in range(GECICI_HAVUZ_BOYUTU):
+            _temp_pool.put(tempfile.mkdtemp(dir=upload_folder))
+        app.config['UPLOAD_FOLDER'] = upload_folder
+        threading.Thread(target=_cleanup_worker, name='gecici-temizlik', daemon=True).start()
+
+
+@app.before_request
+def _ensure_storage():
+    if not app.config['UPLOAD_FOLDER']:
+        init_storage()
+
+
+# ─── Analiz Havuzu ────────────────────────────────────────────────────────────
+_analysis_pool = None
+
+
+def get_analysis_pool():
+    """Belge analizleri için ortak süreç havuzunu (ilk kullanımda) döndürür.
+
+    Havuz istekler arasında paylaşılır. İşçiler çok iş parçacıklı sunucu sürecinden
+    fork ile değil 'spawn' ile başlatılır; başka iş parçacıklarının tuttuğu kilitler
+    işçilere kopyalanıp kilitlenmeye yol açmaz.
+    """
+    global _analysis_pool
+    with _init_lock:
+        if _analysis_pool is None:
+            _analysis_pool = create_executor(mp_context=multiprocessing.get_context('spawn'))
+        return _analysis_pool
 
 
 # ─── Web Rotaları ─────────────────────────────────────────────────────────────
-@app.route('/')
-def index():
-    """Ana sayfa."""
+@lru_cache(maxsize=1)
+def _render_index():
+    """Ana sayfayı bir kez oluşturur (kütüphane durumları çalışma boyunca değişmez)."""
     library_status = {
         'openpyxl': HAS_OPENPYXL,
         'xlrd': HAS_XLRD,
         'python-docx': HAS_DOCX,
-        'pdfplumber': HAS_PDF
+        'pdfplumber': HAS_PDF,
+        'python-calamine': HAS_CALAMINE,
+        'PyMuPDF': HAS_FITZ
     }
     return render_template('index.html', library_status=library_status)
 
 
+@app.route('/')
+def index():
+    """Ana sayfa."""
+    if app.debug:
+        _render_index.cache_clear()  # Geliştirmede şablon değişiklikleri anında görünsün
+    return Response(_render_index(), mimetype='text/html')
+
+
 @app.route('/upload', methods=['POST'])
 def upload_file():
-    """Tek dosya yükleme ve analiz."""
+    """Tek dosya yükleme ve analiz (`?fast=1` ile Word ve PDF'lerde hızlı metin modu)."""
     if 'file' not in request.files:
         return jsonify({'error': 'Dosya seçilmedi'}), 400
     
@@ -84,12 +338,12 @@ def upload_file():
         return jsonify({'error': 'Bu dosya türü desteklenmiyor'}), 400
     
     filename = secure_filename(file.filename)
-    temp_dir = tempfile.mkdtemp(dir=app.config['UPLOAD_FOLDER'])
+    temp_dir = acquire_temp_dir()
     filepath = os.path.join(temp_dir, filename)
-    file.save(filepath)
+    save_upload(file, filepath, request.content_length)
     
     try:
-        ext = Path(filename).suffix.lower()
+        ext = get_extension(filename)
         result = {
             'filename': filename,
             'size': format_size(os.path.getsize(filepath)),
@@ -97,29 +351,38 @@ def upload_file():
             'analysis': None
         }
         
-        if ext in EXCEL_EXTENSIONS or ext in EXCEL_OLD_EXTENSIONS:
-            result['analysis'] = analyze_excel(filepath)
+        category = get_file_category(ext)
+        if category == 'excel':
+            result['analysis'] = analyze_excel(filepath, cache=False)
             result['category'] = 'excel'
-        elif ext in WORD_EXTENSIONS:
-            result['analysis'] = analyze_word(filepath)
+        elif category == 'word':
+            # Büyük belgelerde python-docx tüm XML ağacını belleğe alır; akış moduna geç
+            fast = request.args.get('fast') == '1' or os.path.getsize(filepath) > WORD_AKIS_ESIGI
+            result['analysis'] = analyze_word(filepath, fast=fast, cache=False)
             result['category'] = 'word'
-        elif ext in PDF_EXTENSIONS:
-            result['analysis'] = analyze_pdf(filepath)
+        elif category == 'pdf':
+            # Tek dosya yüklemesinde (hızlı mod istenmedikçe) tam analiz yapılır
+            fast = request.args.get('fast') == '1'
+            result['analysis'] = analyze_pdf(filepath, fast=fast, deep=not fast, cache=False)
             result['category'] = 'pdf'
         elif ext == '.zip':
             # ZIP dosyasını çıkar ve analiz et
             extract_dir = os.path.join(temp_dir, 'extracted')
             with zipfile.ZipFile(filepath, 'r') as zip_ref:
-                zip_ref.extractall(extract_dir)
+                error = check_zip_budget(zip_ref, extract_dir)
+                if error:
+                    return jsonify({'error': error}), 413
+                extract_zip(zip_ref, extract_dir)
             
             # Klasör analizi yap
-            result['analysis'] = analyze_folder_web(extract_dir)
+            result['analysis'] = analyze_folder_web(extract_dir, cache=False)
             result['category'] = 'folder'
         else:
             result['analysis'] = 'Bu dosya türü için detaylı analiz mevcut değil.'
             result['category'] = 'other'
         
-        return jsonify(result)
+        result['report_id'] = save_report(result)
+        return ojsonify(result)
     
     except Exception as e:
         return jsonify({'error': f'Analiz hatası: {str(e)}'}), 500
@@ -143,15 +406,18 @@ def upload_folder():
         return jsonify({'error': 'Lütfen ZIP dosyası yükleyin'}), 400
     
     filename = secure_filename(file.filename)
-    temp_dir = tempfile.mkdtemp(dir=app.config['UPLOAD_FOLDER'])
+    temp_dir = acquire_temp_dir()
     filepath = os.path.join(temp_dir, filename)
-    file.save(filepath)
+    save_upload(file, filepath, request.content_length)
     
     try:
         # ZIP'i çıkar
         extract_dir = os.path.join(temp_dir, 'project')
         with zipfile.ZipFile(filepath, 'r') as zip_ref:
-            zip_ref.extractall(extract_dir)
+            error = check_zip_budget(zip_ref, extract_dir)
+            if error:
+                return jsonify({'error': error}), 413
+            extract_zip(zip_ref, extract_dir)
         
         # __MACOSX gibi klasörleri sil
         macosx_dir = os.path.join(extract_dir, '__MACOSX')
@@ -159,16 +425,17 @@ def upload_folder():
             shutil.rmtree(macosx_dir)
         
         # Eğer tek bir ana klasör varsa, ona in
-        subdirs = [d for d in os.listdir(extract_dir) if os.path.isdir(os.path.join(extract_dir, d))]
-        if len(subdirs) == 1 and not os.listdir(extract_dir) == subdirs:
-            files_in_root = [f for f in os.listdir(extract_dir) if os.path.isfile(os.path.join(extract_dir, f))]
-            if not files_in_root:
-                extract_dir = os.path.join(extract_dir, subdirs[0])
+        with os.scandir(extract_dir) as it:
+            entries = list(it)
+        subdirs = [e.name for e in entries if e.is_dir(follow_symlinks=False)]
+        if len(subdirs) == 1 and len(entries) == 1:
+            extract_dir = os.path.join(extract_dir, subdirs[0])
         
         # Analiz yap
-        analysis_result = analyze_folder_full(extract_dir)
+        analysis_result = analyze_folder_full(extract_dir, cache=False)
         
-        return jsonify(analysis_result)
+        analysis_result['report_id'] = save_report(analysis_result)
+        return ojsonify(analysis_result)
     
     except zipfile.BadZipFile:
         return jsonify({'error': 'Geçersiz ZIP dosyası'}), 400
@@ -188,32 +455,38 @@ def upload_folder_files():
     if not files or len(files) == 0:
         return jsonify({'error': 'Dosya seçilmedi'}), 400
     
-    temp_dir = tempfile.mkdtemp(dir=app.config['UPLOAD_FOLDER'])
+    temp_dir = acquire_temp_dir()
     
     try:
         # Dosyaları yapıyı koruyarak kaydet
+        uploads = []
         for file in files:
             if file.filename:
                 # Göreli yolu al ve güvenli hale getir
                 relative_path = file.filename
-                # Klasör yapısını oluştur
-                file_dir = os.path.join(temp_dir, os.path.dirname(relative_path))
-                os.makedirs(file_dir, exist_ok=True)
-                # Dosyayı kaydet
-                file_path = os.path.join(temp_dir, relative_path)
-                file.save(file_path)
-        
+                uploads.append((file, os.path.join(temp_dir, relative_path)))
+
+        # Klasör yapısını tek seferde oluştur
+        for file_dir in {os.path.dirname(file_path) for _, file_path in uploads}:
+            os.makedirs(file_dir, exist_ok=True)
+
+        # Dosyaları paralel kaydet (her dosya ayrı bir akıştan okunur)
+        with ThreadPoolExecutor() as ex:
+            list(ex.map(lambda item: save_upload(*item), uploads))
+
         # Ana klasörü bul (ilk seviye klasör)
-        subdirs = [d for d in os.listdir(temp_dir) if os.path.isdir(os.path.join(temp_dir, d))]
+        with os.scandir(temp_dir) as it:
+            subdirs = [e.name for e in it if e.is_dir(follow_symlinks=False)]
         if len(subdirs) == 1:
             extract_dir = os.path.join(temp_dir, subdirs[0])
         else:
             extract_dir = temp_dir
         
         # Analiz yap
-        analysis_result = analyze_folder_full(extract_dir)
+        analysis_result = analyze_folder_full(extract_dir, cache=False)
         
-        return jsonify(analysis_result)
+        analysis_result['report_id'] = save_report(analysis_result)
+        return ojsonify(analysis_result)
     
     except Exception as e:
         return jsonify({'error': f'Analiz hatası: {str(e)}'}), 500
@@ -224,6 +497,88 @@ def upload_folder_files():
 def analyze_path():
     """Yerel klasör yolunu analiz et (sunucu tarafı)."""
     data = request.get_json()
+    error = _check_folder_path(data)
+    if error:
+        return error
+    
+    try:
+        analysis_result = analyze_folder_full(data['path'], cache=_use_cache(data['path']))
+        analysis_result['report_id'] = save_report(analysis_result)
+        return ojsonify(analysis_result)
+    except Exception as e:
+        return jsonify({'error': f'Analiz hatası: {str(e)}'}), 500
+
+
+@app.route('/analyze-path-stream', methods=['POST'])
+def analyze_path_stream():
+    """Yerel klasörü analiz eder ve sonucu NDJSON akışı olarak döndürür.
+
+    İlk satır özettir (`summary`), sonraki her satır hazır olan bir klasör raporudur (`folder`).
+    """
+    data = request.get_json()
+    error = _check_folder_path(data)
+    if error:
+        return error
+    folder_path = data['path']
+    
+    def generate():
+        try:
+            parts = iter_folder_analysis(folder_path, cache=_use_cache(folder_path))
+            yield _json_bytes({'summary': next(parts)}) + b'\n'
+            for folder_report in parts:
+                yield _json_bytes({'folder': folder_report}) + b'\n'
+        except Exception as e:
+            yield _json_bytes({'error': f'Analiz hatası: {str(e)}'}) + b'\n'
+    
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+
+@app.route('/download/<report_id>')
+def download_report(report_id):
+    """Kaydedilmiş analiz raporunu indirir (sendfile ve ETag/Last-Modified ile)."""
+    if not re.fullmatch(r'[0-9a-f]{32}', report_id):
+        return jsonify({'error': 'Geçersiz rapor kimliği'}), 400
+    
+    report_dir = os.path.join(RAPOR_ARSIVI, report_id)
+    try:
+        filename = os.listdir(report_dir)[0]
+    except (OSError, IndexError):
+        return jsonify({'error': 'Rapor bulunamadı veya süresi doldu'}), 404
+    
+    path = os.path.join(report_dir, filename)
+    return send_file(path, mimetype='text/markdown', as_attachment=True, download_name=filename,
+                     conditional=True, etag=True, last_modified=os.path.getmtime(path))
+
+
+# Kütüphane durumları içe aktarma anında belli olduğundan yanıt bir kez hazırlanır
+_LIBRARY_STATUS_JSON = _json_bytes({
+    'openpyxl': {'installed': HAS_OPENPYXL, 'description': 'Excel .xlsx dosyaları için'},
+    'xlrd': {'installed': HAS_XLRD, 'description': 'Eski Excel .xls dosyaları için'},
+    'python-docx': {'installed': HAS_DOCX, 'description': 'Word .docx dosyaları için'},
+    'pdfplumber': {'installed': HAS_PDF, 'description': 'PDF dosyaları için'},
+    'python-calamine': {'installed': HAS_CALAMINE, 'description': 'Hızlı Excel okuma için (opsiyonel)'},
+    'PyMuPDF': {'installed': HAS_FITZ, 'description': 'Hızlı PDF okuma için (opsiyonel)'}
+})
+
+
+@app.route('/library-status')
+def library_status():
+    """Kütüphane durumlarını döndürür."""
+    return Response(_LIBRARY_STATUS_JSON, mimetype='application/json')
+
+
+@app.route('/cache/clear', methods=['POST'])
+def cache_clear():
+    """Analiz önbelleğini temizler."""
+    try:
+        return jsonify({'cleared': clear_analysis_cache()})
+    except Exception as e:
+        return jsonify({'error': f'Önbellek temizlenemedi: {str(e)}'}), 500
+
+
+# ─── Yardımcı Fonksiyonlar ────────────────────────────────────────────────────
+def _check_folder_path(data):
+    """İstekteki klasör yolunu doğrular; hata varsa (yanıt, kod) döndürür."""
     if not data or 'path' not in data:
         return jsonify({'error': 'Klasör yolu belirtilmedi'}), 400
     
@@ -235,32 +590,31 @@ def analyze_path():
     if not os.path.isdir(folder_path):
         return jsonify({'error': 'Belirtilen yol bir klasör değil'}), 400
     
-    try:
-        analysis_result = analyze_folder_full(folder_path)
-        return jsonify(analysis_result)
-    except Exception as e:
-        return jsonify({'error': f'Analiz hatası: {str(e)}'}), 500
+    return None
 
 
-@app.route('/library-status')
-def library_status():
-    """Kütüphane durumlarını döndürür."""
-    return jsonify({
-        'openpyxl': {'installed': HAS_OPENPYXL, 'description': 'Excel .xlsx dosyaları için'},
-        'xlrd': {'installed': HAS_XLRD, 'description': 'Eski Excel .xls dosyaları için'},
-        'python-docx': {'installed': HAS_DOCX, 'description': 'Word .docx dosyaları için'},
-        'pdfplumber': {'installed': HAS_PDF, 'description': 'PDF dosyaları için'}
-    })
+def _use_cache(folder_path):
+    """Sunucu tarafı klasör analizinde önbelleğin kullanılıp kullanılmayacağını döndürür.
+
+    Önbellek web arayüzünde isteğe bağlıdır (WEB_ONBELLEK). Yükleme klasörü altındaki
+    yollar her istekte yeni geçici klasörlere düştüğünden hiç önbelleğe alınmaz.
+    """
+    if not WEB_ONBELLEK:
+        return False
+    upload_root = os.path.realpath(app.config['UPLOAD_FOLDER'])
+    try:
+        return os.path.commonpath([os.path.realpath(folder_path), upload_root]) != upload_root
+    except ValueError:
+        return True  # Farklı sürücülerdeki yollar (Windows)
 
 
-# ─── Yardımcı Fonksiyonlar ────────────────────────────────────────────────────
-def analyze_folder_web(folder_path):
-    """Web için klasör analizi yapar."""
+def analyze_folder_web(folder_path, cache=True):
+    """Web için klasör analizi yapar (`cache` False ise analiz önbelleği kullanılmaz)."""
+    clear_scan_cache()  # Önceki isteklerden kalan tarama sonuçlarını kullanma
     result = []
-    folder = Path(folder_path)
     
     # Klasör ağacı
-    tree = build_tree(str(folder))
+    tree = build_tree(folder_path)
     result.append("## 🌳 Klasör Yapısı\n```")
     result.append("\n".join(tree))
     result.append("```\n")
@@ -276,96 +630,120 @@ def analyze_folder_web(folder_path):
         if files:
             result.append(f"- **{cat.title()}:** {len(files)}")
     
-    # Detaylı analizler
+    # Detaylı analizler: birden fazla belge varsa havuzda paralel çalışır, sonuçlar
+    # aşağıda özgün sırayla eklenir
+    analyses = None
+    if len(categories['excel']) + len(categories['word']) + len(categories['pdf']) > 1:
+        analyses = collect_analyses(submit_analyses(get_analysis_pool(), categories, cache=cache))
+    
+    # Tek belge bu iş parçacığında, havuzdakiyle aynı boyut sınırı ve hata yönetimiyle analiz edilir
+    def add_analysis(kind, f):
+        if analyses is not None:
+            result.append(analyses[f.path])
+        else:
+            analyze_one(kind, f.path, out=result, size=f.size, cache=cache)
+    
     if categories['excel']:
         result.append("\n## 📊 Excel Dosyaları\n")
         for f in categories['excel']:
             result.append(f"### {f.name}\n")
-            result.append(analyze_excel(str(f)))
+            add_analysis('excel', f)
     
     if categories['word']:
         result.append("\n## 📝 Word Dosyaları\n")
         for f in categories['word']:
             result.append(f"### {f.name}\n")
-            result.append(analyze_word(str(f)))
+            add_analysis('word', f)
     
     if categories['pdf']:
         result.append("\n## 📕 PDF Dosyaları\n")
         for f in categories['pdf']:
             result.append(f"### {f.name}\n")
-            result.append(analyze_pdf(str(f)))
+            add_analysis('pdf', f)
     
     return "\n".join(result)
 
 
-def analyze_folder_full(folder_path):
-    """Tam klasör analizi yapar ve sonuçları JSON olarak döndürür."""
+def iter_folder_analysis(folder_path, cache=True):
+    """Tam klasör analizini parça parça üretir.
+
+    Önce özet sözlüğü (istatistikler, ağaç, ana rapor), ardından her alt klasörün
+    raporu hazır oldukça klasör sırasıyla üretilir. `cache` False ise analiz önbelleği
+    kullanılmaz.
+    """
+    clear_scan_cache()  # Önceki isteklerden kalan tarama sonuçlarını kullanma
     root = Path(folder_path).resolve()
+    root_str = str(root)
     
-    # İstatistikler
+    # İstatistikler ve alt klasörler (tek geçişte)
     total_files = 0
     total_dirs = 0
     total_size = 0
-    file_type_stats = {}
-    
-    for dirpath, dirnames, filenames in os.walk(str(root)):
-        dirnames[:] = [d for d in dirnames if d not in IGNORED_DIRS 
-                       and not d.startswith('.') and d != RAPOR_KLASOR_ADI]
-        total_dirs += len(dirnames)
-        for fname in filenames:
-            if not fname.startswith('.') and fname != RAPOR_DOSYA_ADI:
-                total_files += 1
-                fpath = os.path.join(dirpath, fname)
-                try:
-                    total_size += os.path.getsize(fpath)
-                except:
-                    pass
-                ext = Path(fname).suffix.lower()
-                if ext:
-                    file_type_stats[ext] = file_type_stats.get(ext, 0) + 1
+    file_type_stats = Counter()
+    root_categories = None
+    report_dirs = []
+    
+    for dirpath, subdirs, files in walk_tree(root_str):
+        total_dirs += len(subdirs)
+        total_files += len(files)
+        for f in files:
+            if f.size is not None:
+                total_size += f.size
+        file_type_stats.update(ext for ext in (get_extension(f.name) for f in files) if ext)
+        # Kategorileri bir kez hesapla, raporlarda yeniden kullan
+        if dirpath == root_str:
+            root_categories = categorize_files(dirpath, files)
+        elif files:
+            report_dirs.append((dirpath, categorize_files(dirpath, files)))
     
     # Klasör ağacı
-    tree = build_tree(str(root))
+    tree = build_tree(root_str)
     
-    # Ana klasör analizi
-    main_report = generate_folder_report(str(root), str(root))
+    # Tüm klasörlerin Excel/Word/PDF analizleri ortak havuza baştan gönderilir; raporlar
+    # bu iş parçacığında klasör sırasıyla, analiz sonuçları hazır oldukça oluşturulur
+    pool = get_analysis_pool()
+    root_pending = submit_analyses(pool, root_categories, cache=cache)
+    pending = [submit_analyses(pool, categories, cache=cache) for _, categories in report_dirs]
     
-    # Alt klasör analizleri
-    folder_reports = []
-    for dirpath, dirnames, filenames in os.walk(str(root)):
-        dirnames[:] = [d for d in dirnames if d not in IGNORED_DIRS 
-                       and not d.startswith('.') and d != RAPOR_KLASOR_ADI]
+    try:
+        yield {
+            'name': root.name,
+            'path': root_str,
+            'stats': {
+                'total_files': total_files,
+                'total_dirs': total_dirs,
+                'total_size': format_size(total_size),
+                'total_size_bytes': total_size
+            },
+            'file_types': dict(file_type_stats),
+            'tree': "\n".join(tree),
+            'main_report': generate_folder_report(root_str, root_str, root_categories,
+                                                  analyses=collect_analyses(root_pending)),
+            'timestamp': datetime.now().isoformat()
+        }
         
-        real_files = [f for f in filenames if not f.startswith('.') and f != RAPOR_DOSYA_ADI]
-        if real_files and dirpath != str(root):
-            folder = Path(dirpath)
-            try:
-                relative = str(folder.relative_to(root))
-            except:
-                relative = folder.name
-            
-            report = generate_folder_report(dirpath, str(root))
-            folder_reports.append({
-                'path': relative,
-                'name': folder.name,
+        # Alt klasör analizleri (sıra korunur)
+        for (dirpath, categories), futures in zip(report_dirs, pending):
+            report = generate_folder_report(dirpath, root_str, categories,
+                                            analyses=collect_analyses(futures))
+            yield {
+                'path': relative_path(dirpath, root_str),
+                'name': os.path.basename(dirpath),
                 'report': report
-            })
-    
-    return {
-        'name': root.name,
-        'path': str(root),
-        'stats': {
-            'total_files': total_files,
-            'total_dirs': total_dirs,
-            'total_size': format_size(total_size),
-            'total_size_bytes': total_size
-        },
-        'file_types': file_type_stats,
-        'tree': "\n".join(tree),
-        'main_report': main_report,
-        'folder_reports': folder_reports,
-        'timestamp': datetime.now().isoformat()
-    }
+            }
+    finally:
+        # Akış yarıda kalırsa (ör. istemci bağlantıyı kapatırsa) başlamamış analizleri iptal et
+        for futures in [root_pending, *pending]:
+            for future in futures.values():
+                future.cancel()
+
+
+def analyze_folder_full(folder_path, cache=True):
+    """Tam klasör analizi yapar ve sonuçları JSON olarak döndürür."""
+    parts = iter_folder_analysis(folder_path, cache)
+    result = next(parts)
+    result['folder_reports'] = list(parts)
+    return result
 
 
 # ─── Hata Yakalama ────────────────────────────────────────────────────────────
@@ -384,6 +762,40 @@ def server_error(e):
     return jsonify({'error': 'Sunucu hatası'}), 500
 
 
+# ─── İstek Boyutu Sınırı ──────────────────────────────────────────────────────
+class ContentLengthLimit:
+    """Content-Length sınırı aşan istekleri gövdeyi okumadan 413 ile reddeden WSGI katmanı.
+
+    Böylece aşırı büyük yüklemeler form ayrıştırıcıya ve geçici klasöre hiç ulaşmaz.
+    Content-Length bildirmeyen (chunked) isteklerde sınır Flask'ın MAX_CONTENT_LENGTH
+    kontrolüyle, gövde okunurken uygulanır.
+    """
+    
+    def __init__(self, wsgi_app, max_length):
+        self.wsgi_app = wsgi_app
+        self.max_length = max_length
+    
+    def __call__(self, environ, start_response):
+        try:
+            length = int(environ.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            length = 0
+        
+        if length > self.max_length:
+            body = _json_bytes({'error': 'Dosya çok büyük (maksimum 500 MB)'})
+            start_response('413 Request Entity Too Large', [
+                ('Content-Type', 'application/json'),
+                ('Content-Length', str(len(body))),
+                ('Connection', 'close'),
+            ])
+            return [body]
+        
+        return self.wsgi_app(environ, start_response)
+
+
+app.wsgi_app = ContentLengthLimit(app.wsgi_app, app.config['MAX_CONTENT_LENGTH'])
+
+
 # ─── Uygulama Başlatma ────────────────────────────────────────────────────────
 if __name__ == '__main__':
     import argparse
@@ -404,6 +816,8 @@ if __name__ == '__main__':
 📦 Kütüphaneler:
    {'✅' if HAS_OPENPYXL else '❌'} openpyxl (Excel .xlsx)
    {'✅' if HAS_XLRD else '❌'} xlrd (Excel .xls)
+   {'✅' if HAS_CALAMINE else '➖'} python-calamine (hızlı Excel okuma, opsiyonel)
+   {'✅' if HAS_FITZ else '➖'} PyMuPDF (hızlı PDF okuma, opsiyonel)
    {'✅' if HAS_DOCX else '❌'} python-docx (Word)
    {'✅' if HAS_PDF else '❌'} pdfplumber (PDF)
 
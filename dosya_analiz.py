@@ -19,37 +19,55 @@ Kullanım:
 import os
 import sys
 import re
+import time
 import datetime
 import shutil
+import sqlite3
+import signal
+import hashlib
 import argparse
+import functools
+import inspect
+import importlib.util
+import zipfile
+import threading
+import contextlib
+from itertools import islice
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 
 # ─── Opsiyonel kütüphaneler ───────────────────────────────────────────────────
-try:
-    import openpyxl
-    from openpyxl.utils import get_column_letter
-    HAS_OPENPYXL = True
-except ImportError:
-    HAS_OPENPYXL = False
+# Yalnızca varlık kontrolü yapılır; kütüphaneler ilk kullanıldıkları analizde içe aktarılır
+# (web sunucusu ve işçi süreçleri kullanmadıkları kütüphaneleri yüklemez)
+def _has_module(name):
+    """Modülün içe aktarılmadan kurulu olup olmadığını kontrol eder."""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
 
-try:
-    from docx import Document as DocxDocument
-    HAS_DOCX = True
-except ImportError:
-    HAS_DOCX = False
 
-try:
-    import pdfplumber
-    HAS_PDF = True
-except ImportError:
-    HAS_PDF = False
+HAS_OPENPYXL = _has_module('openpyxl')
+HAS_DOCX = _has_module('docx')
+HAS_PDF = _has_module('pdfplumber')
+HAS_XLRD = _has_module('xlrd')
+HAS_FITZ = _has_module('pymupdf') or _has_module('fitz')
+HAS_CALAMINE = _has_module('python_calamine')
+HAS_LXML = _has_module('lxml')
+HAS_PDFIUM = _has_module('pypdfium2')  # pdfplumber ile birlikte gelir
 
-try:
-    import xlrd
-    HAS_XLRD = True
-except ImportError:
-    HAS_XLRD = False
+
+def _import_fitz():
+    """PyMuPDF modülünü içe aktarır (eski sürümlerde modül adı `fitz`)."""
+    try:
+        import pymupdf as fitz
+    except ImportError:
+        import fitz  # PyMuPDF < 1.24.3
+    if hasattr(fitz, 'no_recommend_layout'):
+        fitz.no_recommend_layout()  # find_tables'ın rapor çıktısına karışan öneri mesajını kapat
+    return fitz
 
 
 # ─── Yardımcı sabitler ────────────────────────────────────────────────────────
@@ -69,53 +87,227 @@ CODE_EXTENSIONS = {
 }
 ARCHIVE_EXTENSIONS = {'.zip', '.tar', '.gz', '.rar', '.7z', '.bz2', '.xz'}
 
-IGNORED_DIRS = {
+IGNORED_DIRS = frozenset({
     '__pycache__', 'node_modules', '.git', '.svn', '.hg', '.DS_Store',
     '.idea', '.vscode', 'venv', 'env', '.env', '.venv', 'dist', 'build',
     '__MACOSX', '.tox', '.mypy_cache', '.pytest_cache',
-}
+})
 
 RAPOR_KLASOR_ADI = "_ANALIZ_RAPORLARI"
 RAPOR_DOSYA_ADI = "_KLASOR_RAPORU.md"
 
+# Taramada inilmeyen klasör adları (tek üyelik testi için rapor klasörü de dahil)
+_ATLANAN_KLASORLER = IGNORED_DIRS | {RAPOR_KLASOR_ADI}
+
+# Analiz sonuçları önbelleği (DOSYA_ANALIZ_CACHE boş bırakılırsa devre dışı). Varsayılan
+# konum paylaşılan geçici klasör değil, kullanıcının kendi önbellek klasörüdür
+_VARSAYILAN_ONBELLEK = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'dosya_analiz', 'cache.sqlite3')
+ONBELLEK_DOSYASI = os.environ.get('DOSYA_ANALIZ_CACHE', _VARSAYILAN_ONBELLEK)
+ONBELLEK_OMRU_GUN = 30
+
+# Bu boyutun üzerindeki Excel dosyaları salt okunur modda (akış halinde) açılır
+EXCEL_SALT_OKUMA_ESIGI = 5 * 1024 * 1024
+
+# Bu boyutun üzerindeki Word dosyaları akış modunda (lxml) analiz edilir
+WORD_AKIS_ESIGI = 10 * 1024 * 1024
+# PDF tabloları yalnızca ilk bu kadar sayfada aranır (rapora yalnızca onlar yazılır)
+PDF_TABLO_SAYFA_SINIRI = 5
+# PyMuPDF yokken bu kadar ve daha fazla sayfalı PDF'lerde (--deep olmadan) yalnızca
+# sayfa sayısı ve metadata okunur
+PDF_OZET_SAYFA_ESIGI = 20
+# pdfplumber sayfaları bu kadar iş parçacığında, her biri kendi dosya tanıtıcısıyla okunur
+PDF_SAYFA_ISCI_SAYISI = 4
+# Bir iş parçacığına düşen en az sayfa (dosyayı yeniden açma maliyetine değsin diye)
+PDF_PARCA_MIN_SAYFA = 5
+
+# Klasör analizinde bu boyutun üzerindeki Excel/Word/PDF dosyaları atlanır (`--full` ile zorlanır)
+ANALIZ_BOYUT_SINIRI = 200 * 1024 * 1024
+# Tek bir dosya analizinin süre sınırı (saniye, analiz başladığı andan itibaren)
+ANALIZ_ZAMAN_ASIMI = 60
+# Süre sınırı işçide uygulanamazsa sonuç bu kadar saniye daha beklenir
+ANALIZ_BEKLEME_PAYI = 5
+
+# Rapor dosyaları bu boyutta tamponla yazılır
+RAPOR_YAZMA_TAMPONU = 1 << 20
+# Kod dosyası önizlemesi için baştan okunan bayt sayısı (ilk 5 satır buradan alınır)
+KOD_ONIZLEME_BAYT = 4096
+
+# Formül içindeki hücre/aralık referansları (ör. `B2`, `D2:D11`)
+_FORMULA_REF_RE = re.compile(r"[A-Z]+[0-9]+(?::[A-Z]+[0-9]+)?")
+
 # ─── Boyut formatlama ─────────────────────────────────────────────────────────
+_BOYUT_BIRIMLERI = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
+@functools.lru_cache(maxsize=4096)
 def format_size(size_bytes):
     """Byte cinsinden boyutu okunabilir formata çevirir."""
+    if size_bytes is None:
+        return "?"
     if size_bytes == 0:
         return "0 B"
-    units = ['B', 'KB', 'MB', 'GB', 'TB']
-    i = 0
-    size = float(size_bytes)
-    while size >= 1024 and i < len(units) - 1:
-        size /= 1024
-        i += 1
-    return f"{size:.1f} {units[i]}"
+    # Birim basamağı = 1024'ün kaçıncı kuvveti; 2'nin kuvvetine bölme kayıpsızdır
+    i = min((int(size_bytes).bit_length() - 1) // 10, len(_BOYUT_BIRIMLERI) - 1)
+    return f"{size_bytes / (1 << (i * 10)):.1f} {_BOYUT_BIRIMLERI[i]}"
+
+
+# ─── Analiz önbelleği ─────────────────────────────────────────────────────────
+# Kod değiştiğinde eski sonuçlar kullanılmasın diye modülün zaman damgası anahtara katılır
+_KOD_SURUMU = os.stat(__file__).st_mtime_ns
+_cache_pruned = False
+
+# Bu işaretleri içeren sonuçlar (dosya açılamadı, kütüphane eksik) önbelleğe yazılmaz;
+# kilitli dosya gibi geçici hatalar kalıcı hale gelmesin
+_HATA_ISARETLERI = ("  > ❌ ", "  > ⚠️ `")
+
+
+def _cache_connect():
+    """Önbellek veritabanına bağlanır; süreç başına bir kez eski kayıtları siler.
+
+    Varsayılan konumda klasör yalnızca kullanıcıya açık (0700) oluşturulur; klasör başka
+    birine aitse veya başkalarınca yazılabiliyorsa önbellek kullanılmaz (OSError).
+    """
+    global _cache_pruned
+    if ONBELLEK_DOSYASI == _VARSAYILAN_ONBELLEK:
+        folder = os.path.dirname(ONBELLEK_DOSYASI)
+        os.makedirs(folder, mode=0o700, exist_ok=True)
+        if hasattr(os, 'getuid'):
+            st = os.stat(folder)
+            if st.st_uid != os.getuid() or st.st_mode & 0o022:
+                raise PermissionError(f"Güvensiz önbellek klasörü: {folder}")
+    conn = sqlite3.connect(ONBELLEK_DOSYASI, timeout=5)
+    conn.execute("CREATE TABLE IF NOT EXISTS analiz (anahtar TEXT PRIMARY KEY, sonuc TEXT, zaman REAL)")
+    if not _cache_pruned:
+        _cache_pruned = True
+        with conn:
+            conn.execute("DELETE FROM analiz WHERE zaman < ?",
+                         (time.time() - ONBELLEK_OMRU_GUN * 86400,))
+    return conn
+
+
+def cached_analyzer(func):
+    """Analiz sonucunu dosyanın yolu, boyutu ve değişiklik zamanı ile anahtarlayarak
+    disk önbelleğinde saklar.
+
+    Anahtar bu stat bilgisi + fonksiyon adı + parametreler + yüklü kütüphanelerden oluşur;
+    dosya içeriği okunmaz, dosya değişince kayıt kendiliğinden geçersizleşir. Hata
+    sonuçları saklanmaz. Sarmalanan fonksiyon `out` listesi de alır: verilirse sonuç
+    döndürülmek yerine listeye eklenir. `cache=False` ile önbellek hiç açılmaz (ör. bir
+    daha görülmeyecek geçici yüklemeler).
+    """
+    signature = inspect.signature(func)
+
+    def cached_call(filepath, *args, **kwargs):
+        if not ONBELLEK_DOSYASI:
+            return func(filepath, *args, **kwargs)
+        # Varsayılan değerler de anahtara girsin: f(x) ile f(x, fast=False) aynı kayıt
+        bound = signature.bind(filepath, *args, **kwargs)
+        bound.apply_defaults()
+        params = sorted((k, v) for k, v in bound.arguments.items() if k != 'filepath')
+        try:
+            realpath = os.path.realpath(filepath)
+            st = os.stat(realpath)
+        except OSError:
+            return func(filepath, *args, **kwargs)
+        backends = (HAS_OPENPYXL, HAS_DOCX, HAS_PDF, HAS_XLRD, HAS_CALAMINE, HAS_FITZ,
+                    HAS_LXML, HAS_PDFIUM)
+        key_src = repr((func.__name__, realpath, st.st_size, st.st_mtime_ns, params,
+                        backends, _KOD_SURUMU))
+        key = hashlib.sha1(key_src.encode('utf-8')).hexdigest()
+        
+        # Okuma ve yazma aynı bağlantıyla yapılır
+        try:
+            conn = _cache_connect()
+        except (OSError, sqlite3.Error):
+            return func(filepath, *args, **kwargs)
+        try:
+            try:
+                row = conn.execute("SELECT sonuc FROM analiz WHERE anahtar = ?", (key,)).fetchone()
+                if row is not None:
+                    return row[0]
+            except sqlite3.Error:
+                pass
+            
+            result = func(filepath, *args, **kwargs)
+            
+            if not any(mark in result for mark in _HATA_ISARETLERI):
+                try:
+                    with conn:
+                        conn.execute("INSERT OR REPLACE INTO analiz VALUES (?, ?, ?)",
+                                     (key, result, time.time()))
+                except sqlite3.Error:
+                    pass
+            return result
+        finally:
+            conn.close()
+
+    @functools.wraps(func)
+    def wrapper(filepath, *args, out=None, cache=True, **kwargs):
+        if cache:
+            result = cached_call(filepath, *args, **kwargs)
+        else:
+            result = func(filepath, *args, **kwargs)
+        if out is None:
+            return result
+        out.append(result)
+    return wrapper
+
+
+def clear_analysis_cache():
+    """Analiz önbelleğini boşaltır, silinen kayıt sayısını döndürür."""
+    if not ONBELLEK_DOSYASI or not os.path.exists(ONBELLEK_DOSYASI):
+        return 0
+    conn = _cache_connect()
+    try:
+        with conn:
+            return conn.execute("DELETE FROM analiz").rowcount
+    finally:
+        conn.close()
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # EXCEL ANALİZİ
 # ═══════════════════════════════════════════════════════════════════════════════
-def analyze_excel(filepath):
-    """Excel dosyasını detaylı analiz eder."""
+@cached_analyzer
+def analyze_excel(filepath, deep=False):
+    """Excel dosyasını detaylı analiz eder.
+
+    5 MB ve üzeri dosyalar salt okunur modda açılır; birleştirilmiş hücreler, tablolar,
+    veri doğrulama, koşullu biçimlendirme, grafikler ve yorumlar için `deep=True` gerekir.
+    """
     report = []
-    ext = Path(filepath).suffix.lower()
+    ext = get_extension(filepath)
 
     if ext in EXCEL_OLD_EXTENSIONS:
+        if HAS_CALAMINE:
+            return _analyze_excel_calamine(filepath)
         return _analyze_excel_xls(filepath)
 
     if not HAS_OPENPYXL:
+        # Formül/biçim bilgisi olmadan da olsa hızlı okuyucu ile temel analiz
+        if HAS_CALAMINE:
+            return _analyze_excel_calamine(filepath)
         report.append("  > ⚠️ `openpyxl` kütüphanesi yüklü değil. Excel analizi yapılamadı.")
         report.append("  > Yüklemek için: `pip install openpyxl`")
         return "\n".join(report)
 
+    import openpyxl
+    from openpyxl.utils import get_column_letter
+
     try:
-        wb = openpyxl.load_workbook(filepath, data_only=False, read_only=False)
+        read_only = not deep and os.path.getsize(filepath) >= EXCEL_SALT_OKUMA_ESIGI
+        wb = openpyxl.load_workbook(filepath, data_only=False, read_only=read_only, keep_links=False)
     except Exception as e:
         report.append(f"  > ❌ Dosya açılamadı: {e}")
         return "\n".join(report)
 
     report.append(f"  - **Sayfa Sayısı:** {len(wb.sheetnames)}")
     report.append(f"  - **Sayfalar:** {', '.join(wb.sheetnames)}")
+    if read_only:
+        report.append("  > ℹ️ Büyük dosya: salt okunur modda analiz edildi (birleştirilmiş hücreler, tablolar, "
+                      "veri doğrulama, koşullu biçimlendirme, grafikler ve yorumlar atlandı; tümü için `--deep`).")
     report.append("")
 
     # Tanımlı isimler (Named Ranges)
@@ -140,9 +332,13 @@ def analyze_excel(filepath):
         ws = wb[sheet_name]
         report.append(f"  #### 📄 Sayfa: `{sheet_name}`")
 
-        # Boyut bilgisi
-        if ws.dimensions and ws.dimensions != 'A1:A1':
-            report.append(f"  - **Veri Aralığı:** `{ws.dimensions}`")
+        # Boyut bilgisi (salt okunur sayfada boyut etiketi yoksa satırlar taranarak hesaplanır)
+        try:
+            dimensions = ws.calculate_dimension(force=True) if read_only else ws.dimensions
+        except Exception:
+            dimensions = None
+        if dimensions and dimensions != 'A1:A1':
+            report.append(f"  - **Veri Aralığı:** `{dimensions}`")
         
         min_row = ws.min_row or 1
         max_row = ws.max_row or 1
@@ -151,42 +347,58 @@ def analyze_excel(filepath):
         report.append(f"  - **Satır Sayısı:** {max_row - min_row + 1}")
         report.append(f"  - **Sütun Sayısı:** {max_col - min_col + 1}")
 
-        # Başlık satırını çıkar (ilk satır)
-        headers = []
-        try:
-            for col in range(min_col, min(max_col + 1, 50)):  # max 50 sütun
-                cell = ws.cell(row=min_row, column=col)
-                if cell.value is not None:
-                    headers.append(str(cell.value))
-            if headers:
-                report.append(f"  - **Başlık Sütunları:** {', '.join(f'`{h}`' for h in headers)}")
-        except:
-            pass
-
-        # Birleştirilmiş hücreler
-        if ws.merged_cells.ranges:
-            report.append(f"  - **Birleştirilmiş Hücreler:** {len(ws.merged_cells.ranges)} adet")
-            merged_list = [str(m) for m in list(ws.merged_cells.ranges)[:20]]
-            report.append(f"    - Aralıklar: {', '.join(f'`{m}`' for m in merged_list)}")
-            if len(ws.merged_cells.ranges) > 20:
-                report.append(f"    - ... ve {len(ws.merged_cells.ranges) - 20} adet daha")
-
-        # Formülleri bul
+        # Başlık satırı, formüller, yorumlar ve örnek veri tek geçişte toplanır (salt okunur
+        # modda her iter_rows sayfa XML'ini baştan ayrıştırır). Başlık ve örnek veri her iki
+        # modda da aynı kaynaktan gelir: formül hücrelerinde formül metni gösterilir.
+        header_ncols = min(max_col, 49) - min_col + 1
+        header_row = None
         formulas = []
         cell_dependencies = defaultdict(list)
+        comments = []
+        # Örnek veri: ilk 6 satır × en fazla 15 sütun (aralık dışı hücreler boş kalır)
+        sample_nrows = min(min_row + 5, max_row + 1) - min_row + 1
+        sample_ncols = min(max_col + 1, 15) - min_col + 1
+        sample_rows = [[None] * sample_ncols for _ in range(sample_nrows)]
+        sample_error = None
         try:
-            for row in ws.iter_rows(min_row=min_row, max_row=min(max_row, 5000),
-                                     min_col=min_col, max_col=min(max_col, 100)):
-                for cell in row:
-                    if cell.value and isinstance(cell.value, str) and cell.value.startswith('='):
+            for r, row in enumerate(ws.iter_rows(min_row=min_row, max_row=min(max_row, 5000),
+                                                 min_col=min_col, max_col=min(max_col, 100))):
+                if r == 0:
+                    header_row = [cell.value for cell in row[:header_ncols]]
+                sample_row = sample_rows[r] if r < sample_nrows else None
+                for c, cell in enumerate(row):
+                    value = cell.value
+                    if value is None:
+                        continue
+                    if sample_row is not None and c < sample_ncols:
+                        sample_row[c] = value
+                    if isinstance(value, str) and value.startswith('='):
                         cell_ref = f"{get_column_letter(cell.column)}{cell.row}"
-                        formulas.append((cell_ref, cell.value))
+                        formulas.append((cell_ref, value))
                         # Bağımlılıkları çıkar
-                        refs = re.findall(r"[A-Z]+[0-9]+(?::[A-Z]+[0-9]+)?", cell.value)
-                        for ref in refs:
+                        for ref in _FORMULA_REF_RE.findall(value):
                             cell_dependencies[cell_ref].append(ref)
-        except:
-            pass
+                    if not read_only and cell.comment:
+                        cell_ref = f"{get_column_letter(cell.column)}{cell.row}"
+                        comments.append((cell_ref, cell.comment.text[:100]))
+        except Exception as e:
+            sample_error = e
+        if read_only:
+            del sample_rows[max_row - min_row + 1:]  # Salt okunur sayfa veri sonundan öteye satır üretmez
+
+        # Başlık satırı (ilk satır, en fazla 49 sütun)
+        headers = [str(v) for v in header_row or () if v is not None]
+        if headers:
+            report.append(f"  - **Başlık Sütunları:** {', '.join(f'`{h}`' for h in headers)}")
+
+        # Birleştirilmiş hücreler
+        merged = ws.merged_cells.ranges if not read_only else None
+        if merged:
+            report.append(f"  - **Birleştirilmiş Hücreler:** {len(merged)} adet")
+            merged_list = [str(m) for m in islice(merged, 20)]
+            report.append(f"    - Aralıklar: {', '.join(f'`{m}`' for m in merged_list)}")
+            if len(merged) > 20:
+                report.append(f"    - ... ve {len(merged) - 20} adet daha")
 
         if formulas:
             report.append(f"  - **Formül Sayısı:** {len(formulas)}")
@@ -224,7 +436,7 @@ def analyze_excel(filepath):
             report.append("")
 
         # Tablolar (ListObject)
-        if hasattr(ws, 'tables') and ws.tables:
+        if not read_only and ws.tables:
             report.append(f"  - **Tablo Sayısı:** {len(ws.tables)}")
             for table_name, table in ws.tables.items():
                 report.append(f"    - 📊 Tablo: `{table_name}` → Aralık: `{table.ref}`")
@@ -233,32 +445,20 @@ def analyze_excel(filepath):
                     report.append(f"      - Sütunlar: {', '.join(f'`{c}`' for c in cols)}")
 
         # Veri doğrulama
-        if hasattr(ws, 'data_validations') and ws.data_validations.dataValidation:
+        if not read_only and ws.data_validations.dataValidation:
             report.append(f"  - **Veri Doğrulama Kuralları:** {len(ws.data_validations.dataValidation)} adet")
             for dv in ws.data_validations.dataValidation[:10]:
                 report.append(f"    - Hücreler: `{dv.sqref}` | Tip: `{dv.type}` | Değerler: `{dv.formula1}`")
 
         # Koşullu biçimlendirme
-        if ws.conditional_formatting:
-            cf_count = len(list(ws.conditional_formatting))
-            report.append(f"  - **Koşullu Biçimlendirme:** {cf_count} kural")
+        if not read_only and ws.conditional_formatting:
+            report.append(f"  - **Koşullu Biçimlendirme:** {len(ws.conditional_formatting)} kural")
 
         # Grafikler
-        if hasattr(ws, '_charts') and ws._charts:
+        if not read_only and ws._charts:
             report.append(f"  - **Grafik Sayısı:** {len(ws._charts)}")
         
         # Yorumlar / Notlar
-        comments = []
-        try:
-            for row in ws.iter_rows(min_row=min_row, max_row=min(max_row, 5000),
-                                     min_col=min_col, max_col=min(max_col, 100)):
-                for cell in row:
-                    if cell.comment:
-                        cell_ref = f"{get_column_letter(cell.column)}{cell.row}"
-                        comments.append((cell_ref, cell.comment.text[:100]))
-        except:
-            pass
-        
         if comments:
             report.append(f"  - **Yorum/Not Sayısı:** {len(comments)}")
             for cell_ref, text in comments[:10]:
@@ -268,11 +468,8 @@ def analyze_excel(filepath):
         report.append("")
         report.append("  **Örnek Veri (İlk 5 Satır):**")
         try:
-            sample_rows = list(ws.iter_rows(
-                min_row=min_row, max_row=min(min_row + 5, max_row + 1),
-                min_col=min_col, max_col=min(max_col + 1, 15),
-                values_only=True
-            ))
+            if sample_error is not None:
+                raise sample_error
             if sample_rows and any(any(c is not None for c in row) for row in sample_rows):
                 # Markdown tablo oluştur
                 col_count = len(sample_rows[0]) if sample_rows else 0
@@ -295,6 +492,42 @@ def analyze_excel(filepath):
     return "\n".join(report)
 
 
+def _analyze_excel_calamine(filepath):
+    """Excel dosyasını python-calamine (Rust tabanlı okuyucu) ile analiz eder.
+
+    Formül ve biçim bilgisi okunmaz; sayfa yapısı ve başlıklar çok daha hızlı çıkarılır.
+    """
+    from python_calamine import CalamineWorkbook
+
+    report = []
+    try:
+        wb = CalamineWorkbook.from_path(filepath)
+    except Exception as e:
+        report.append(f"  > ❌ Dosya açılamadı: {e}")
+        return "\n".join(report)
+
+    report.append(f"  - **Sayfa Sayısı:** {len(wb.sheet_names)}")
+    report.append(f"  - **Sayfalar:** {', '.join(wb.sheet_names)}")
+    report.append("")
+    for sheet_name in wb.sheet_names:
+        report.append(f"  #### 📄 Sayfa: `{sheet_name}`")
+        try:
+            ws = wb.get_sheet_by_name(sheet_name)
+            report.append(f"  - **Satır Sayısı:** {ws.height}")
+            report.append(f"  - **Sütun Sayısı:** {ws.width}")
+            # İlk satır (başlıklar, max 50 sütun)
+            first_rows = ws.to_python(nrows=1)
+            if first_rows:
+                headers = [str(v) for v in first_rows[0][:50] if v not in (None, '')]
+                if headers:
+                    report.append(f"  - **Başlık Sütunları:** {', '.join(f'`{h}`' for h in headers)}")
+        except Exception as e:
+            report.append(f"  > Sayfa okunamadı: {e}")
+        report.append("")
+
+    return "\n".join(report)
+
+
 def _analyze_excel_xls(filepath):
     """Eski format .xls dosyasını analiz eder."""
     report = []
@@ -303,6 +536,8 @@ def _analyze_excel_xls(filepath):
         report.append("  > Yüklemek için: `pip install xlrd`")
         return "\n".join(report)
     
+    import xlrd
+    
     try:
         wb = xlrd.open_workbook(filepath)
         report.append(f"  - **Sayfa Sayısı:** {wb.nsheets}")
@@ -327,8 +562,17 @@ def _analyze_excel_xls(filepath):
 # ═══════════════════════════════════════════════════════════════════════════════
 # WORD ANALİZİ
 # ═══════════════════════════════════════════════════════════════════════════════
-def analyze_word(filepath):
-    """Word dosyasını analiz eder."""
+@cached_analyzer
+def analyze_word(filepath, fast=False):
+    """Word dosyasını analiz eder.
+
+    `fast` True ise (lxml ile) python-docx nesne modeli kurulmaz; belge
+    `_analyze_word_stream` ile tek XML geçişinde okunur. Tablo önizlemesi ve
+    üstbilgi/altbilgi bu modda atlanır.
+    """
+    if fast and HAS_LXML:
+        return _analyze_word_stream(filepath)
+    
     report = []
     
     if not HAS_DOCX:
@@ -336,6 +580,9 @@ def analyze_word(filepath):
         report.append("  > Yüklemek için: `pip install python-docx`")
         return "\n".join(report)
     
+    from docx import Document as DocxDocument
+    from docx.enum.style import WD_STYLE_TYPE
+    
     try:
         doc = DocxDocument(filepath)
     except Exception as e:
@@ -343,16 +590,48 @@ def analyze_word(filepath):
         return "\n".join(report)
     
     # Genel bilgiler
-    paragraphs = doc.paragraphs
     tables = doc.tables
     
-    # Metin istatistikleri
-    total_text = "\n".join([p.text for p in paragraphs if p.text.strip()])
+    # Başlık stilleri bir kez çözülür (stil kimliği → seviye); paragraf başına yalnızca
+    # ham pStyle kimliği okunur. Tanımsız/eksik kimlikler, python-docx'teki gibi
+    # varsayılan paragraf stiline düşer.
+    paragraph_style_ids = set()
+    heading_levels = {}
+    default_style_id = None
+    for style in doc.styles:
+        if style.type != WD_STYLE_TYPE.PARAGRAPH:
+            continue
+        paragraph_style_ids.add(style.style_id)
+        if style.element.default:
+            default_style_id = style.style_id
+        name = style.name
+        if name and name.startswith('Heading'):
+            try:
+                heading_levels[style.style_id] = int(name.replace('Heading', '').replace(' ', ''))
+            except:
+                heading_levels[style.style_id] = 1
+    
+    # Metin istatistikleri ve başlıklar: paragraflar üzerinde tek geçiş
+    text_parts = []
+    headings = []
+    for p in doc.paragraphs:
+        text = p.text
+        stripped = text.strip()
+        if not stripped:
+            continue
+        text_parts.append(text)
+        style_id = p._p.style
+        if style_id not in paragraph_style_ids:
+            style_id = default_style_id
+        level_num = heading_levels.get(style_id)
+        if level_num is not None:
+            headings.append((level_num, stripped))
+    
+    total_text = "\n".join(text_parts)
     word_count = len(total_text.split()) if total_text else 0
     char_count = len(total_text)
-    non_empty_paragraphs = [p for p in paragraphs if p.text.strip()]
     
-    report.append(f"  - **Paragraf Sayısı:** {len(non_empty_paragraphs)}")
+    report.append(f"  - **Paragraf Sayısı:** {len(text_parts)}")
     report.append(f"  - **Kelime Sayısı:** {word_count}")
     report.append(f"  - **Karakter Sayısı:** {char_count}")
     report.append(f"  - **Tablo Sayısı:** {len(tables)}")
@@ -361,18 +640,6 @@ def analyze_word(filepath):
     if doc.sections:
         report.append(f"  - **Bölüm (Section) Sayısı:** {len(doc.sections)}")
     
-    # Başlıkları çıkar
-    headings = []
-    for p in paragraphs:
-        if p.style and p.style.name and p.style.name.startswith('Heading'):
-            level = p.style.name.replace('Heading', '').replace(' ', '')
-            try:
-                level_num = int(level)
-            except:
-                level_num = 1
-            if p.text.strip():
-                headings.append((level_num, p.text.strip()))
-    
     if headings:
         report.append("")
         report.append("  #### 📑 Başlık Yapısı (İçindekiler)")
@@ -447,18 +714,248 @@ def analyze_word(filepath):
     return "\n".join(report)
 
 
+_W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_BODY = _W_NS + 'body'
+_W_P = _W_NS + 'p'
+_W_T = _W_NS + 't'
+_W_TBL = _W_NS + 'tbl'
+_W_TR = _W_NS + 'tr'
+_W_GRIDCOL = _W_NS + 'gridCol'
+_W_SECTPR = _W_NS + 'sectPr'
+_W_PSTYLE = _W_NS + 'pStyle'
+_W_VAL = _W_NS + 'val'
+
+
+def _analyze_word_stream(filepath):
+    """Word dosyasını document.xml üzerinden akış halinde analiz eder (sabit bellek)."""
+    report = []
+    
+    if not HAS_LXML:
+        report.append("  > ⚠️ `lxml` kütüphanesi yüklü değil. Word akış analizi yapılamadı.")
+        report.append("  > Yüklemek için: `pip install lxml`")
+        return "\n".join(report)
+    
+    from lxml import etree
+    
+    paragraph_count = 0
+    word_count = 0
+    char_count = 0
+    preview = []
+    preview_len = 0
+    headings = []
+    tables = []
+    section_count = 0
+    image_count = 0
+    
+    try:
+        with zipfile.ZipFile(filepath) as zf:
+            with zf.open('word/document.xml') as xml:
+                for _, elem in etree.iterparse(xml, events=('end',), tag=(_W_P, _W_TBL, _W_SECTPR)):
+                    parent = elem.getparent()
+                    
+                    if elem.tag == _W_SECTPR:
+                        section_count += 1
+                        continue
+                    if parent is None or parent.tag != _W_BODY:
+                        continue  # Tablo içindeki paragraflar tablo ile birlikte temizlenir
+                    
+                    if elem.tag == _W_P:
+                        text = "".join(t.text or "" for t in elem.iter(_W_T))
+                        stripped = text.strip()
+                        if stripped:
+                            char_count += len(text) + (1 if paragraph_count else 0)
+                            paragraph_count += 1
+                            word_count += len(text.split())
+                            if preview_len <= 500:
+                                preview.append(text)
+                                preview_len += len(text) + 1
+                            
+                            style = elem.find(f'{_W_NS}pPr/{_W_PSTYLE}')
+                            style_id = style.get(_W_VAL) if style is not None else None
+                            if style_id and style_id.startswith('Heading'):
+                                try:
+                                    level_num = int(style_id[len('Heading'):])
+                                except ValueError:
+                                    level_num = 1
+                                headings.append((level_num, stripped))
+                    else:
+                        rows = sum(1 for _ in elem.iterchildren(_W_TR))
+                        cols = sum(1 for _ in elem.iter(_W_GRIDCOL))
+                        tables.append((rows, cols))
+                    
+                    # Ağacın işlenen kısmını serbest bırak
+                    elem.clear()
+                    while elem.getprevious() is not None:
+                        del parent[0]
+            
+            try:
+                rels = etree.fromstring(zf.read('word/_rels/document.xml.rels'))
+                image_count = sum(1 for rel in rels if rel.get('Type', '').endswith('/image'))
+            except (KeyError, etree.XMLSyntaxError):
+                pass
+    except Exception as e:
+        report.append(f"  > ❌ Dosya açılamadı: {e}")
+        return "\n".join(report)
+    
+    report.append(f"  - **Paragraf Sayısı:** {paragraph_count}")
+    report.append(f"  - **Kelime Sayısı:** {word_count}")
+    report.append(f"  - **Karakter Sayısı:** {char_count}")
+    report.append(f"  - **Tablo Sayısı:** {len(tables)}")
+    
+    if section_count:
+        report.append(f"  - **Bölüm (Section) Sayısı:** {section_count}")
+    
+    if headings:
+        report.append("")
+        report.append("  #### 📑 Başlık Yapısı (İçindekiler)")
+        for level, text in headings:
+            indent = "  " * level
+            report.append(f"  {indent}- {text}")
+        report.append("")
+    
+    if tables:
+        report.append("  #### 📊 Tablolar")
+        for i, (rows, cols) in enumerate(tables[:10]):
+            report.append(f"  **Tablo {i + 1}:** {rows} satır × {cols} sütun")
+        report.append("")
+        if len(tables) > 10:
+            report.append(f"  > ... ve {len(tables) - 10} tablo daha")
+    
+    report.append("  > ℹ️ Akış modu: tablo içerikleri ve üstbilgi/altbilgi atlandı.")
+    
+    # Metin önizleme (ilk 500 karakter)
+    if preview:
+        text = "\n".join(preview)
+        report.append("")
+        report.append("  #### 📝 İçerik Önizleme")
+        report.append(f"  > {text[:500].replace(chr(10), ' ').strip()}{'...' if char_count > 500 else ''}")
+    
+    if image_count:
+        report.append(f"  - **Gömülü Resim Sayısı:** {image_count}")
+    
+    return "\n".join(report)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # PDF ANALİZİ
 # ═══════════════════════════════════════════════════════════════════════════════
-def analyze_pdf(filepath):
-    """PDF dosyasını analiz eder."""
+def _pdf_table_count_line(total_tables, page_count):
+    """Tablo sayısı satırı; tablolar yalnızca ilk sayfalarda arandığından bunu belirtir."""
+    if page_count > PDF_TABLO_SAYFA_SINIRI:
+        return f"  - **Tablo Sayısı (ilk {PDF_TABLO_SAYFA_SINIRI} sayfa):** {total_tables}"
+    return f"  - **Toplam Tablo Sayısı:** {total_tables}"
+
+
+def _pdfplumber_page_range(filepath, start, stop, cancel=None):
+    """[start, stop) sayfalarını kendi pdfplumber tanıtıcısıyla okur.
+
+    Her sayfa için (metin, tablolar, resim sayısı) döndürür. pdfminer belge
+    durumunu paylaştığından iş parçacıkları aynı `pdf` nesnesini kullanmaz.
+    `cancel` (threading.Event) kurulursa sonraki sayfaya geçilmeden durulur.
+    """
+    import pdfplumber
+    
+    pages = []
+    with pdfplumber.open(filepath) as pdf:
+        for i in range(start, stop):
+            if cancel is not None and cancel.is_set():
+                break
+            page = pdf.pages[i]
+            text = page.extract_text() or ""
+            # extract_tables en pahalı işlem; yalnızca rapora yazılan sayfalarda çalıştır
+            tables = (page.extract_tables() or []) if i < PDF_TABLO_SAYFA_SINIRI else []
+            pages.append((text, tables, len(page.images or [])))
+            page.close()
+    return pages
+
+
+def _pdfplumber_pages(filepath, page_count):
+    """İlk `page_count` sayfayı sayfa aralıklarına bölüp paralel okur, sırayla döndürür."""
+    chunk = max(PDF_PARCA_MIN_SAYFA, -(-page_count // PDF_SAYFA_ISCI_SAYISI))
+    ranges = [(start, min(start + chunk, page_count)) for start in range(0, page_count, chunk)]
+    if len(ranges) <= 1:
+        return _pdfplumber_page_range(filepath, 0, page_count)
+    
+    cancel = threading.Event()
+    pool = ThreadPoolExecutor(max_workers=len(ranges))
+    try:
+        parts = list(pool.map(lambda r: _pdfplumber_page_range(filepath, *r, cancel), ranges))
+    except BaseException:
+        # Zaman aşımı (veya hata) durumunda okuyucuları beklemeden durdur
+        cancel.set()
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    pool.shutdown()
+    return [page for part in parts for page in part]
+
+
+def _pdf_metadata_lines(meta, report):
+    """pdfplumber/pypdfium2 biçimindeki metadata sözlüğünü rapora ekler."""
+    if meta.get('Title'):
+        report.append(f"  - **Başlık:** {meta['Title']}")
+    if meta.get('Author'):
+        report.append(f"  - **Yazar:** {meta['Author']}")
+    if meta.get('Subject'):
+        report.append(f"  - **Konu:** {meta['Subject']}")
+    if meta.get('Creator'):
+        report.append(f"  - **Oluşturan:** {meta['Creator']}")
+    if meta.get('CreationDate'):
+        report.append(f"  - **Oluşturma Tarihi:** {meta['CreationDate']}")
+
+
+def _analyze_pdf_summary(filepath, min_pages):
+    """PDF'in yalnızca sayfa sayısını ve metadata'sını pypdfium2 ile okur.
+
+    Sayfa sayısı `min_pages` altındaysa veya dosya açılamazsa None döner (tam analiz yapılır).
+    """
+    import pypdfium2 as pdfium
+    
+    try:
+        pdf = pdfium.PdfDocument(filepath)
+    except Exception:
+        return None
+    try:
+        page_count = len(pdf)
+        if page_count < min_pages:
+            return None
+        meta = pdf.get_metadata_dict()
+    finally:
+        pdf.close()
+    
+    report = [f"  - **Sayfa Sayısı:** {page_count}"]
+    _pdf_metadata_lines(meta, report)
+    report.append("")
+    report.append("  > ℹ️ Özet mod: sayfa detayları, tablolar ve içerik önizleme atlandı "
+                  "(tam analiz için `--deep`).")
+    return "\n".join(report)
+
+
+@cached_analyzer
+def analyze_pdf(filepath, fast=False, deep=False):
+    """PDF dosyasını analiz eder.
+
+    PyMuPDF yüklüyse o kullanılır, değilse pdfplumber. `fast` True ise (PyMuPDF ile)
+    tablo çıkarma atlanır, yalnızca metin analizi yapılır. PyMuPDF yokken
+    PDF_OZET_SAYFA_ESIGI ve üzeri sayfalı belgelerde (`fast` ile tümünde) `deep`
+    verilmedikçe yalnızca sayfa sayısı ve metadata okunur.
+    """
     report = []
     
+    if HAS_FITZ:
+        return _analyze_pdf_fitz(filepath, tables=not fast)
+    
+    if HAS_PDFIUM and not deep:
+        summary = _analyze_pdf_summary(filepath, 0 if fast else PDF_OZET_SAYFA_ESIGI)
+        if summary is not None:
+            return summary
+    
     if not HAS_PDF:
         report.append("  > ⚠️ `pdfplumber` kütüphanesi yüklü değil. PDF analizi yapılamadı.")
         report.append("  > Yüklemek için: `pip install pdfplumber`")
         return "\n".join(report)
     
+    import pdfplumber
+    
     try:
         with pdfplumber.open(filepath) as pdf:
             page_count = len(pdf.pages)
@@ -466,65 +963,53 @@ def analyze_pdf(filepath):
             
             # Metadata
             if pdf.metadata:
-                meta = pdf.metadata
-                if meta.get('Title'):
-                    report.append(f"  - **Başlık:** {meta['Title']}")
-                if meta.get('Author'):
-                    report.append(f"  - **Yazar:** {meta['Author']}")
-                if meta.get('Subject'):
-                    report.append(f"  - **Konu:** {meta['Subject']}")
-                if meta.get('Creator'):
-                    report.append(f"  - **Oluşturan:** {meta['Creator']}")
-                if meta.get('CreationDate'):
-                    report.append(f"  - **Oluşturma Tarihi:** {meta['CreationDate']}")
+                _pdf_metadata_lines(pdf.metadata, report)
             
             # Her sayfayı analiz et
             all_text = []
             total_tables = 0
             total_images = 0
+            preview_tables = []  # İlk sayfaların tabloları: (sayfa no, tablo no, tablo)
             
             report.append("")
             report.append("  #### 📄 Sayfa Detayları")
             
-            for i, page in enumerate(pdf.pages[:50]):  # Max 50 sayfa detay
-                page_text = page.extract_text() or ""
+            for i, (page_text, tables, image_count) in enumerate(
+                    _pdfplumber_pages(filepath, min(page_count, 50))):  # Max 50 sayfa detay
                 word_count = len(page_text.split())
-                tables = page.extract_tables() or []
-                images = page.images or []
                 
                 total_tables += len(tables)
-                total_images += len(images)
+                total_images += image_count
                 all_text.append(page_text)
+                preview_tables.extend((i, j, table) for j, table in enumerate(tables[:3]))
                 
                 if i < 10:  # İlk 10 sayfa detay göster
                     report.append(f"  - **Sayfa {i + 1}:** {word_count} kelime"
                                   f"{f', {len(tables)} tablo' if tables else ''}"
-                                  f"{f', {len(images)} resim' if images else ''}")
+                                  f"{f', {image_count} resim' if image_count else ''}")
             
             report.append("")
-            report.append(f"  - **Toplam Tablo Sayısı:** {total_tables}")
+            report.append(_pdf_table_count_line(total_tables, page_count))
             report.append(f"  - **Toplam Resim Sayısı:** {total_images}")
             
-            # İlk sayfanın tablolarını göster
-            for i, page in enumerate(pdf.pages[:5]):
-                tables = page.extract_tables() or []
-                for j, table in enumerate(tables[:3]):
-                    if table and len(table) > 0:
-                        report.append(f"")
-                        report.append(f"  **Sayfa {i+1} - Tablo {j+1}:**")
-                        # Başlık satırı
-                        if table[0]:
-                            headers = [str(c)[:25] if c else '' for c in table[0]]
-                            report.append("  | " + " | ".join(headers) + " |")
-                            report.append("  | " + " | ".join(['---'] * len(headers)) + " |")
-                            for row in table[1:4]:
-                                cells = [str(c)[:25] if c else '' for c in row]
-                                # Sütun sayısını eşitle
-                                while len(cells) < len(headers):
-                                    cells.append('')
-                                report.append("  | " + " | ".join(cells[:len(headers)]) + " |")
-                            if len(table) > 4:
-                                report.append(f"  | *... {len(table) - 4} satır daha* |")
+            # İlk sayfaların tablolarını göster
+            for i, j, table in preview_tables:
+                if table and len(table) > 0:
+                    report.append(f"")
+                    report.append(f"  **Sayfa {i+1} - Tablo {j+1}:**")
+                    # Başlık satırı
+                    if table[0]:
+                        headers = [str(c)[:25] if c else '' for c in table[0]]
+                        report.append("  | " + " | ".join(headers) + " |")
+                        report.append("  | " + " | ".join(['---'] * len(headers)) + " |")
+                        for row in table[1:4]:
+                            cells = [str(c)[:25] if c else '' for c in row]
+                            # Sütun sayısını eşitle
+                            while len(cells) < len(headers):
+                                cells.append('')
+                            report.append("  | " + " | ".join(cells[:len(headers)]) + " |")
+                        if len(table) > 4:
+                            report.append(f"  | *... {len(table) - 4} satır daha* |")
             
             # İçerik önizleme
             full_text = "\n".join(all_text)
@@ -544,73 +1029,296 @@ def analyze_pdf(filepath):
     return "\n".join(report)
 
 
+def _analyze_pdf_fitz(filepath, tables=True):
+    """PDF dosyasını PyMuPDF ile analiz eder (pdfplumber'dan çok daha hızlı).
+
+    `tables` False ise tablo çıkarma atlanır (hızlı mod).
+    """
+    report = []
+    fitz = _import_fitz()
+    
+    try:
+        with fitz.open(filepath) as doc:
+            page_count = doc.page_count
+            report.append(f"  - **Sayfa Sayısı:** {page_count}")
+            
+            # Metadata
+            meta = doc.metadata or {}
+            if meta.get('title'):
+                report.append(f"  - **Başlık:** {meta['title']}")
+            if meta.get('author'):
+                report.append(f"  - **Yazar:** {meta['author']}")
+            if meta.get('subject'):
+                report.append(f"  - **Konu:** {meta['subject']}")
+            if meta.get('creator'):
+                report.append(f"  - **Oluşturan:** {meta['creator']}")
+            if meta.get('creationDate'):
+                report.append(f"  - **Oluşturma Tarihi:** {meta['creationDate']}")
+            
+            all_text = []
+            total_tables = 0
+            total_images = 0
+            preview_tables = []  # İlk sayfaların tabloları: (sayfa no, tablo no, tablo)
+            
+            report.append("")
+            report.append("  #### 📄 Sayfa Detayları")
+            
+            for i in range(min(page_count, 50)):  # Max 50 sayfa detay
+                page = doc[i]
+                page_text = page.get_text() or ""
+                word_count = len(page_text.split())
+                images = page.get_images()
+                page_tables = []
+                if tables and i < PDF_TABLO_SAYFA_SINIRI:
+                    try:
+                        page_tables = page.find_tables().tables
+                    except Exception:
+                        page_tables = []
+                
+                total_tables += len(page_tables)
+                total_images += len(images)
+                all_text.append(page_text)
+                preview_tables.extend((i, j, table) for j, table in enumerate(page_tables[:3]))
+                
+                if i < 10:  # İlk 10 sayfa detay göster
+                    report.append(f"  - **Sayfa {i + 1}:** {word_count} kelime"
+                                  f"{f', {len(page_tables)} tablo' if page_tables else ''}"
+                                  f"{f', {len(images)} resim' if images else ''}")
+            
+            report.append("")
+            if tables:
+                report.append(_pdf_table_count_line(total_tables, page_count))
+            report.append(f"  - **Toplam Resim Sayısı:** {total_images}")
+            if not tables:
+                report.append("  > ℹ️ Hızlı mod: tablo analizi atlandı.")
+            
+            # İlk sayfaların tablolarını göster
+            for i, j, table in preview_tables:
+                rows = table.extract()
+                if not rows:
+                    continue
+                report.append(f"")
+                report.append(f"  **Sayfa {i+1} - Tablo {j+1}:**")
+                # Başlık satırı
+                if rows[0]:
+                    headers = [str(c)[:25] if c else '' for c in rows[0]]
+                    report.append("  | " + " | ".join(headers) + " |")
+                    report.append("  | " + " | ".join(['---'] * len(headers)) + " |")
+                    for row in rows[1:4]:
+                        cells = [str(c)[:25] if c else '' for c in row]
+                        # Sütun sayısını eşitle
+                        while len(cells) < len(headers):
+                            cells.append('')
+                        report.append("  | " + " | ".join(cells[:len(headers)]) + " |")
+                    if len(rows) > 4:
+                        report.append(f"  | *... {len(rows) - 4} satır daha* |")
+            
+            # İçerik önizleme
+            full_text = "\n".join(all_text)
+            total_word_count = len(full_text.split())
+            report.append("")
+            report.append(f"  - **Toplam Kelime Sayısı:** {total_word_count}")
+            
+            if full_text.strip():
+                preview = full_text[:500].replace('\n', ' ').strip()
+                report.append("")
+                report.append("  #### 📝 İçerik Önizleme")
+                report.append(f"  > {preview}{'...' if len(full_text) > 500 else ''}")
+    
+    except Exception as e:
+        report.append(f"  > ❌ PDF okunamadı: {e}")
+    
+    return "\n".join(report)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # KLASÖR ANALİZİ
 # ═══════════════════════════════════════════════════════════════════════════════
+# Taranan bir dosyanın adı, tam yolu ve tarama sırasında alınan stat bilgisi
+FileInfo = namedtuple('FileInfo', ['name', 'path', 'size', 'mtime'])
+
+
+def _suffix(filename):
+    """Dosya adının uzantısını döndürür (Path.suffix ile aynı kurallar)."""
+    i = filename.rfind('.')
+    return filename[i:] if 0 < i < len(filename) - 1 else ''
+
+
+def get_extension(filename):
+    """Dosya adının uzantısını küçük harfle döndürür."""
+    return _suffix(filename).lower()
+
+
+@functools.lru_cache(maxsize=None)
+def scan_folder(folder_path):
+    """Klasörün girdilerini (_list_dir) alt klasörler ve dosyalar olarak ayırır.
+
+    Gizli/yoksayılan klasörler ve rapor dosyaları atlanır. (alt klasör DirEntry listesi,
+    FileInfo listesi) döndürür; her dosya için stat yalnızca bir kez yapılır. Sonuç
+    analiz boyunca önbellekte tutulur (bkz. clear_scan_cache).
+    """
+    subdirs = []
+    files = []
+    for entry in _list_dir(folder_path):
+        name = entry.name
+        if name[:1] == '.':
+            continue
+        if entry.is_dir():
+            if name not in _ATLANAN_KLASORLER:
+                subdirs.append(entry)
+        elif name != RAPOR_DOSYA_ADI:
+            try:
+                st = entry.stat()
+                files.append(FileInfo(name, entry.path, st.st_size, st.st_mtime))
+            except OSError:
+                files.append(FileInfo(name, entry.path, None, None))
+    return tuple(subdirs), tuple(files)
+
+
+@functools.lru_cache(maxsize=None)
+def _list_dir(folder_path):
+    """Klasörün tüm girdilerini (DirEntry) tek os.scandir çağrısıyla okur.
+
+    scan_folder ve count_files aynı listeyi paylaşır; her klasör analiz boyunca bir kez okunur.
+    """
+    with os.scandir(folder_path) as it:
+        return tuple(it)
+
+
+def clear_scan_cache():
+    """Klasör tarama önbelleğini temizler (her analiz sonunda çağrılır)."""
+    _list_dir.cache_clear()
+    scan_folder.cache_clear()
+    count_files.cache_clear()
+
+
+def walk_tree(root_path):
+    """os.walk yerine scandir tabanlı tarama; (klasör, alt klasörler, dosyalar) üretir."""
+    try:
+        subdirs, files = scan_folder(root_path)
+    except OSError:
+        return
+    yield root_path, subdirs, files
+    for d in subdirs:
+        # os.walk gibi sembolik bağlantılı klasörlere inme
+        if not d.is_symlink():
+            yield from walk_tree(d.path)
+
+
 def build_tree(root_path, prefix="", is_last=True, max_depth=6, current_depth=0):
     """Klasör ağacı oluşturur (metin formatında)."""
-    root = Path(root_path)
     tree_lines = []
     
     if current_depth == 0:
-        tree_lines.append(f"📁 {root.name}/")
+        tree_lines.append(f"📁 {Path(root_path).name}/")
     
     if current_depth >= max_depth:
         tree_lines.append(f"{prefix}{'└── ' if is_last else '├── '}... (derinlik sınırına ulaşıldı)")
         return tree_lines
     
     try:
-        entries = sorted(root.iterdir(), key=lambda e: (not e.is_dir(), e.name.lower()))
+        subdirs, files = scan_folder(str(root_path))
     except PermissionError:
         return tree_lines
     
-    # Filtreleme
-    entries = [e for e in entries if e.name not in IGNORED_DIRS 
-               and not e.name.startswith('.')
-               and e.name != RAPOR_KLASOR_ADI
-               and e.name != RAPOR_DOSYA_ADI]
+    # Klasörler önce, sonra dosyalar (ağaçta yoksayılan klasör adlarına sahip dosyalar da gizlenir)
+    entries = sorted([(True, d) for d in subdirs if d.name != RAPOR_DOSYA_ADI] +
+                     [(False, f) for f in files if f.name not in IGNORED_DIRS],
+                     key=lambda e: (not e[0], e[1].name.lower()))
     
-    for i, entry in enumerate(entries):
+    for i, (is_dir, entry) in enumerate(entries):
         is_entry_last = (i == len(entries) - 1)
         connector = "└── " if is_entry_last else "├── "
         extension = "    " if is_entry_last else "│   "
         
-        if entry.is_dir():
+        if is_dir:
             tree_lines.append(f"{prefix}{connector}📁 {entry.name}/")
-            subtree = build_tree(entry, prefix + extension, is_entry_last, max_depth, current_depth + 1)
+            subtree = build_tree(entry.path, prefix + extension, is_entry_last, max_depth, current_depth + 1)
             tree_lines.extend(subtree)
         else:
-            size = format_size(entry.stat().st_size) if entry.exists() else "?"
-            icon = get_file_icon(entry.suffix.lower())
+            size = format_size(entry.size)
+            icon = get_file_icon(get_extension(entry.name))
             tree_lines.append(f"{prefix}{connector}{icon} {entry.name} ({size})")
     
     return tree_lines
 
 
+@functools.lru_cache(maxsize=None)
+def count_files(folder_path):
+    """Klasördeki tüm dosyaları alt klasörlerle birlikte sayar (sembolik bağlantılı klasörlere inmez).
+
+    Sonuç önbellekte tutulur; iç içe klasörlerin raporlarında her klasör bir kez taranır.
+    """
+    count = 0
+    try:
+        for entry in _list_dir(folder_path):
+            if entry.is_dir(follow_symlinks=False):
+                count += count_files(entry.path)
+            elif entry.is_file():
+                count += 1
+    except OSError:
+        pass
+    return count
+
+
+def _ext_map(groups):
+    """(uzantılar, değer) çiftlerinden uzantı → değer sözlüğü kurar; önce gelen grup önceliklidir."""
+    mapping = {}
+    for extensions, value in groups:
+        for ext in extensions:
+            mapping.setdefault(ext, value)
+    return mapping
+
+
+# Uzantı → ikon / kategori eşlemeleri (dosya başına tek sözlük araması)
+_EXT_TO_ICON = _ext_map([
+    (EXCEL_EXTENSIONS | EXCEL_OLD_EXTENSIONS, "📊"),
+    (WORD_EXTENSIONS, "📝"),
+    (PDF_EXTENSIONS, "📕"),
+    (IMAGE_EXTENSIONS, "🖼️"),
+    (CODE_EXTENSIONS, "💻"),
+    (ARCHIVE_EXTENSIONS, "📦"),
+    ({'.mp4', '.avi', '.mov', '.mkv', '.webm'}, "🎬"),
+    ({'.mp3', '.wav', '.flac', '.aac', '.ogg'}, "🎵"),
+])
+
+_EXT_TO_CATEGORY = _ext_map([
+    (EXCEL_EXTENSIONS | EXCEL_OLD_EXTENSIONS, 'excel'),
+    (WORD_EXTENSIONS, 'word'),
+    (PDF_EXTENSIONS, 'pdf'),
+    (CODE_EXTENSIONS, 'code'),
+    (IMAGE_EXTENSIONS, 'image'),
+    (ARCHIVE_EXTENSIONS, 'archive'),
+])
+
+# Kategori → ana rapordaki dosya türü etiketi
+_KATEGORI_ETIKETLERI = {
+    'excel': "📊 Excel",
+    'word': "📝 Word",
+    'pdf': "📕 PDF",
+    'code': "💻 Kod",
+    'image': "🖼️ Resim",
+    'archive': "📦 Arşiv",
+    'other': "📄 Diğer",
+}
+
+
 def get_file_icon(ext):
     """Dosya uzantısına göre ikon döndürür."""
-    if ext in EXCEL_EXTENSIONS or ext in EXCEL_OLD_EXTENSIONS:
-        return "📊"
-    elif ext in WORD_EXTENSIONS:
-        return "📝"
-    elif ext in PDF_EXTENSIONS:
-        return "📕"
-    elif ext in IMAGE_EXTENSIONS:
-        return "🖼️"
-    elif ext in CODE_EXTENSIONS:
-        return "💻"
-    elif ext in ARCHIVE_EXTENSIONS:
-        return "📦"
-    elif ext in {'.mp4', '.avi', '.mov', '.mkv', '.webm'}:
-        return "🎬"
-    elif ext in {'.mp3', '.wav', '.flac', '.aac', '.ogg'}:
-        return "🎵"
-    else:
-        return "📄"
-
-
-def categorize_files(folder_path):
-    """Klasördeki dosyaları kategorilere ayırır."""
+    return _EXT_TO_ICON.get(ext, "📄")
+
+
+def get_file_category(ext):
+    """Dosya uzantısına göre kategori döndürür ('excel', 'word', ..., 'other')."""
+    return _EXT_TO_CATEGORY.get(ext, 'other')
+
+
+def categorize_files(folder_path, files=None):
+    """Klasördeki dosyaları kategorilere ayırır.
+
+    `files` verilirse (örn. walk_tree çıktısı) klasör yeniden taranmaz. Dosyalar bir kez
+    ada göre sıralanır; her kategori listesi bu sırayı korur.
+    """
     categories = {
         'excel': [],
         'word': [],
@@ -621,27 +1329,14 @@ def categorize_files(folder_path):
         'other': [],
     }
     
-    folder = Path(folder_path)
-    try:
-        for item in folder.iterdir():
-            if item.is_file() and not item.name.startswith('.') and item.name != RAPOR_DOSYA_ADI:
-                ext = item.suffix.lower()
-                if ext in EXCEL_EXTENSIONS or ext in EXCEL_OLD_EXTENSIONS:
-                    categories['excel'].append(item)
-                elif ext in WORD_EXTENSIONS:
-                    categories['word'].append(item)
-                elif ext in PDF_EXTENSIONS:
-                    categories['pdf'].append(item)
-                elif ext in CODE_EXTENSIONS:
-                    categories['code'].append(item)
-                elif ext in IMAGE_EXTENSIONS:
-                    categories['image'].append(item)
-                elif ext in ARCHIVE_EXTENSIONS:
-                    categories['archive'].append(item)
-                else:
-                    categories['other'].append(item)
-    except PermissionError:
-        pass
+    if files is None:
+        try:
+            files = scan_folder(folder_path)[1]
+        except PermissionError:
+            files = []
+    
+    for item in sorted(files, key=lambda x: x.name.lower()):
+        categories[get_file_category(get_extension(item.name))].append(item)
     
     return categories
 
@@ -649,29 +1344,211 @@ def categorize_files(folder_path):
 # ═══════════════════════════════════════════════════════════════════════════════
 # RAPOR OLUŞTURMA
 # ═══════════════════════════════════════════════════════════════════════════════
-def generate_folder_report(folder_path, root_path):
-    """Bir klasör için detaylı MD rapor oluşturur."""
-    folder = Path(folder_path)
-    root = Path(root_path)
-    relative = folder.relative_to(root)
-    
-    report = []
-    report.append(f"# 📁 Klasör Raporu: `{folder.name}`")
+# Analiz edilen dosya kategorileri → (analiz fonksiyonu, hata etiketi)
+_ANALYZERS = {
+    'excel': (analyze_excel, 'Excel'),
+    'word': (analyze_word, 'Word'),
+    'pdf': (analyze_pdf, 'PDF'),
+}
+
+
+_ZAMAN_ASIMI_NOTU = f"  > ⏱️ Zaman aşımı: analiz {ANALIZ_ZAMAN_ASIMI} saniyede tamamlanmadı."
+
+
+class _AnalizZamanAsimi(BaseException):
+    """Analiz süre sınırını aştığında fırlatılır.
+
+    BaseException'dan türer; analizcilerdeki `except Exception` blokları onu yutmasın.
+    """
+
+
+def _raise_timeout(signum, frame):
+    raise _AnalizZamanAsimi()
+
+
+@contextlib.contextmanager
+def _deadline(seconds):
+    """Bloğu en fazla `seconds` saniye çalıştırır, aşılırsa _AnalizZamanAsimi fırlatır.
+
+    Tek seferlik SIGALRM zamanlayıcısı ile çalışır; yalnızca POSIX'te ve ana iş
+    parçacığında (ör. süreç havuzu işçileri) uygulanır, aksi halde blok sınırsız çalışır.
+    Python'a dönmeyen uzun C çağrıları kesilemez. Çıkışta zamanlayıcı, önceki sinyal
+    işleyicisi geri yüklenmeden önce kapatılır; işçi sonraki görevlerde temiz kalır.
+    """
+    if not hasattr(signal, 'setitimer') or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+    previous = signal.signal(signal.SIGALRM, _raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        try:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        finally:
+            signal.signal(signal.SIGALRM, previous)
+
+
+def analyze_one(kind, path, out=None, full=False, size=None, **options):
+    """Tek bir dosyayı kategorisine göre analiz eder, (yol, markdown) döndürür.
+
+    `out` verilirse sonuç doğrudan bu rapor listesine eklenir. `full` False ise
+    ANALIZ_BOYUT_SINIRI üzerindeki dosyalar açılmadan atlanır; `size` (tarama
+    sırasında alınan boyut) verilirse dosya yeniden stat edilmez. WORD_AKIS_ESIGI
+    üzerindeki Word dosyaları akış modunda okunur. Analiz ANALIZ_ZAMAN_ASIMI saniyede
+    bitmezse durdurulur ve yerine not yazılır (bkz. _deadline).
+    """
+    analyzer, label = _ANALYZERS[kind]
+    try:
+        if size is None:
+            size = os.path.getsize(path)
+        if not full and size > ANALIZ_BOYUT_SINIRI:
+            text = f"  > ⏭️ Atlandı: {format_size(size)} — tam analiz için `--full` kullanın."
+        else:
+            if kind == 'word' and size > WORD_AKIS_ESIGI:
+                options.setdefault('fast', True)
+            with _deadline(ANALIZ_ZAMAN_ASIMI):
+                text = analyzer(path, **options)
+    except _AnalizZamanAsimi:
+        text = _ZAMAN_ASIMI_NOTU
+    except Exception as e:
+        text = f"  > ❌ {label} analiz hatası: {e}"
+    if out is None:
+        return path, text
+    out.append(text)
+
+
+def submit_analyses(executor, categories, deep=False, full=False, cache=True):
+    """Bir klasörün Excel/Word/PDF analizlerini havuza gönderir, {yol: future} döndürür.
+
+    `cache` False ise analiz önbelleği kullanılmaz (bkz. cached_analyzer).
+    """
+    deep_options = {'deep': True} if deep else {}
+    return {f.path: executor.submit(analyze_one, kind, f.path, full=full, size=f.size, cache=cache,
+                                    **(deep_options if kind in ('excel', 'pdf') else {}))
+            for kind in _ANALYZERS for f in categories[kind]}
+
+
+def _wait_result(future):
+    """Sonucu bekler; süre, görev kuyrukta beklerken değil çalışmaya başladığında işler.
+
+    Süre sınırı normalde işçide uygulanır (analyze_one); uygulanamadığı durumlarda
+    (iş parçacığı havuzu, kesilemeyen C kodu) çalışmaya başlamasından itibaren
+    ANALIZ_ZAMAN_ASIMI + ANALIZ_BEKLEME_PAYI saniye sonra FuturesTimeoutError fırlatır.
+    Bu durumda görev arka planda çalışmayı sürdürür.
+    """
+    started = None
+    while True:
+        try:
+            return future.result(timeout=1)
+        except FuturesTimeoutError:
+            if started is None:
+                if future.running():
+                    started = time.monotonic()
+            elif time.monotonic() - started > ANALIZ_ZAMAN_ASIMI + ANALIZ_BEKLEME_PAYI:
+                raise
+
+
+def collect_analyses(futures):
+    """submit_analyses sonuçlarını {yol: markdown} olarak toplar.
+
+    Süre sınırını aşan analizlerin yerine zaman aşımı notu yazılır (bkz. _wait_result).
+    """
+    analyses = {}
+    for path, future in futures.items():
+        try:
+            analyses[path] = _wait_result(future)[1]
+        except FuturesTimeoutError:
+            analyses[path] = _ZAMAN_ASIMI_NOTU
+    return analyses
+
+
+def create_executor(threads=False, mp_context=None):
+    """Dosya analizleri için iş havuzu oluşturur.
+
+    İşçi sayısı `DOSYA_WORKERS` ortam değişkeninden okunur (varsayılan: çekirdek sayısı - 1).
+    `threads` True ise süreç yerine iş parçacığı havuzu kullanılır; `mp_context`
+    süreç havuzunun başlatma yöntemini belirler (ör. çok iş parçacıklı sunucularda 'spawn').
+    """
+    try:
+        workers = int(os.environ['DOSYA_WORKERS'])
+    except (KeyError, ValueError):
+        workers = (os.cpu_count() or 2) - 1
+    workers = max(1, workers)
+    
+    if threads:
+        return ThreadPoolExecutor(max_workers=workers)
+    return ProcessPoolExecutor(max_workers=workers, mp_context=mp_context)
+
+
+class _ReportWriter:
+    """Rapor satırlarını listede biriktirmek yerine doğrudan dosyaya yazar.
+
+    Liste gibi `append` ile kullanılır; satırlar "\n".join ile aynı çıktıyı verecek
+    şekilde ayrılır (sonda yeni satır yok).
+    """
+
+    def __init__(self, fp):
+        self.fp = fp
+        self.started = False
+
+    def append(self, line):
+        if self.started:
+            self.fp.write("\n")
+        self.fp.write(line)
+        self.started = True
+
+
+def _now_str():
+    """Rapor başlıklarındaki tarih biçimiyle o anki zamanı döndürür."""
+    return datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+def relative_path(path, root_str):
+    """`path`'in `root_str`'ye göreli yolunu düz dize işlemiyle döndürür.
+
+    Kök için '.', kökün dışındaki yollar için `path`'in kendisi döner; yollar walk_tree
+    çıktısı gibi aynı kökten üretilmiş olmalıdır.
+    """
+    if path == root_str:
+        return '.'
+    prefix = root_str if root_str.endswith(os.sep) else root_str + os.sep
+    if path.startswith(prefix):
+        return path[len(prefix):]
+    return path
+
+
+def generate_folder_report(folder_path, root_path, categories=None, executor=None, analyses=None,
+                           deep=False, full=False, fp=None, report_date=None):
+    """Bir klasör için detaylı MD rapor oluşturur.
+
+    `categories` verilirse (categorize_files çıktısı) dosyalar yeniden sınıflandırılmaz.
+    `executor` verilirse Excel/Word/PDF analizleri bu havuzda paralel çalıştırılır; süre
+    sınırını aşanların yerine not yazılır (bkz. collect_analyses). `analyses` ({yol: markdown})
+    verilirse hazır analiz sonuçları kullanılır.
+    `deep` True ise büyük Excel ve PDF dosyaları da tam modda analiz edilir; `full` True ise
+    ANALIZ_BOYUT_SINIRI üzerindeki dosyalar da analiz edilir.
+    `fp` (açık metin dosyası) verilirse rapor bellekte birleştirilmeden satır satır
+    ona yazılır ve None döner; aksi halde rapor metni döner.
+    `report_date` (biçimlenmiş tarih) verilirse saat yeniden okunmaz.
+    """
+    relative = relative_path(folder_path, root_path)
+    
+    report = _ReportWriter(fp) if fp is not None else []
+    report.append(f"# 📁 Klasör Raporu: `{os.path.basename(folder_path)}`")
     report.append(f"")
     report.append(f"**Tam Yol:** `{relative}`  ")
-    report.append(f"**Rapor Tarihi:** {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    report.append(f"**Rapor Tarihi:** {report_date or _now_str()}")
     report.append(f"")
     report.append("---")
     report.append("")
     
     # Dosya kategorileri
-    categories = categorize_files(folder_path)
+    if categories is None:
+        categories = categorize_files(folder_path)
     
     # Alt klasörler
-    subdirs = [d for d in folder.iterdir() if d.is_dir() 
-               and d.name not in IGNORED_DIRS 
-               and not d.name.startswith('.')
-               and d.name != RAPOR_KLASOR_ADI]
+    subdirs = scan_folder(folder_path)[0]
     
     # Özet tablo
     total_files = sum(len(v) for v in categories.values())
@@ -702,7 +1579,7 @@ def generate_folder_report(folder_path, root_path):
         report.append("## 📂 Alt Klasörler")
         report.append("")
         for d in sorted(subdirs, key=lambda x: x.name.lower()):
-            sub_file_count = sum(1 for _ in d.rglob('*') if _.is_file())
+            sub_file_count = count_files(d.path)
             report.append(f"- 📁 **{d.name}/** — {sub_file_count} dosya")
         report.append("")
     
@@ -715,32 +1592,41 @@ def generate_folder_report(folder_path, root_path):
         all_files = []
         for cat_files in categories.values():
             all_files.extend(cat_files)
-        for f in sorted(all_files, key=lambda x: x.name.lower()):
-            try:
-                stat = f.stat()
-                size = format_size(stat.st_size)
-                modified = datetime.datetime.fromtimestamp(stat.st_mtime).strftime('%Y-%m-%d %H:%M')
-                icon = get_file_icon(f.suffix.lower())
-                report.append(f"| {icon} `{f.name}` | `{f.suffix}` | {size} | {modified} |")
-            except:
-                report.append(f"| `{f.name}` | `{f.suffix}` | ? | ? |")
+        all_files.sort(key=lambda x: x.name.lower())
+        for f in all_files:
+            suffix = _suffix(f.name)
+            if f.size is None:
+                report.append(f"| `{f.name}` | `{suffix}` | ? | ? |")
+                continue
+            size = format_size(f.size)
+            modified = datetime.datetime.fromtimestamp(f.mtime).strftime('%Y-%m-%d %H:%M')
+            icon = get_file_icon(suffix.lower())
+            report.append(f"| {icon} `{f.name}` | `{suffix}` | {size} | {modified} |")
         report.append("")
     
+    # Excel/Word/PDF analizleri: havuz verilirse önceden paralel çalıştırılır, sonuçlar
+    # aşağıda özgün sırayla eklenir; aksi halde her analiz doğrudan rapora yazılır
+    deep_options = {'deep': True} if deep else {}
+    if analyses is None and executor is not None and sum(len(categories[k]) for k in _ANALYZERS) > 1:
+        analyses = collect_analyses(submit_analyses(executor, categories, deep, full))
+    
+    def add_analysis(kind, file, **options):
+        if analyses is not None:
+            report.append(analyses[file.path])
+        else:
+            analyze_one(kind, file.path, out=report, full=full, size=file.size, **options)
+    
     # Excel analizi
     if categories['excel']:
         report.append("---")
         report.append("")
         report.append("## 📊 Excel Dosya Analizleri")
         report.append("")
-        for excel_file in sorted(categories['excel'], key=lambda x: x.name.lower()):
+        for excel_file in categories['excel']:
             report.append(f"### 📊 `{excel_file.name}`")
-            report.append(f"**Boyut:** {format_size(excel_file.stat().st_size)}")
+            report.append(f"**Boyut:** {format_size(excel_file.size)}")
             report.append("")
-            try:
-                analysis = analyze_excel(str(excel_file))
-                report.append(analysis)
-            except Exception as e:
-                report.append(f"  > ❌ Excel analiz hatası: {e}")
+            add_analysis('excel', excel_file, **deep_options)
             report.append("")
     
     # Word analizi
@@ -749,15 +1635,11 @@ def generate_folder_report(folder_path, root_path):
         report.append("")
         report.append("## 📝 Word Dosya Analizleri")
         report.append("")
-        for word_file in sorted(categories['word'], key=lambda x: x.name.lower()):
+        for word_file in categories['word']:
             report.append(f"### 📝 `{word_file.name}`")
-            report.append(f"**Boyut:** {format_size(word_file.stat().st_size)}")
+            report.append(f"**Boyut:** {format_size(word_file.size)}")
             report.append("")
-            try:
-                analysis = analyze_word(str(word_file))
-                report.append(analysis)
-            except Exception as e:
-                report.append(f"  > ❌ Word analiz hatası: {e}")
+            add_analysis('word', word_file)
             report.append("")
     
     # PDF analizi
@@ -766,15 +1648,11 @@ def generate_folder_report(folder_path, root_path):
         report.append("")
         report.append("## 📕 PDF Dosya Analizleri")
         report.append("")
-        for pdf_file in sorted(categories['pdf'], key=lambda x: x.name.lower()):
+        for pdf_file in categories['pdf']:
             report.append(f"### 📕 `{pdf_file.name}`")
-            report.append(f"**Boyut:** {format_size(pdf_file.stat().st_size)}")
+            report.append(f"**Boyut:** {format_size(pdf_file.size)}")
             report.append("")
-            try:
-                analysis = analyze_pdf(str(pdf_file))
-                report.append(analysis)
-            except Exception as e:
-                report.append(f"  > ❌ PDF analiz hatası: {e}")
+            add_analysis('pdf', pdf_file, **deep_options)
             report.append("")
     
     # Kod dosyaları
@@ -783,24 +1661,26 @@ def generate_folder_report(folder_path, root_path):
         report.append("")
         report.append("## 💻 Kod Dosyaları")
         report.append("")
-        for code_file in sorted(categories['code'], key=lambda x: x.name.lower()):
-            report.append(f"- 💻 `{code_file.name}` ({format_size(code_file.stat().st_size)})")
-            # Kısa açıklama için ilk birkaç satırı oku
+        for code_file in categories['code']:
+            report.append(f"- 💻 `{code_file.name}` ({format_size(code_file.size)})")
+            # Kısa açıklama için ilk birkaç satırı oku (metin akışı kurmadan tek os.read ile)
             try:
-                with open(code_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    first_lines = []
-                    for line_num, line in enumerate(f):
-                        if line_num >= 5:
+                fd = os.open(code_file.path, os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0))
+                try:
+                    head = os.read(fd, KOD_ONIZLEME_BAYT)
+                finally:
+                    os.close(fd)
+                first_lines = []
+                for line in head.decode('utf-8', 'ignore').splitlines()[:5]:
+                    stripped = line.strip()
+                    if stripped and not stripped.startswith('#!'):
+                        first_lines.append(stripped)
+                if first_lines:
+                    # Docstring veya yorum varsa göster
+                    for line in first_lines[:3]:
+                        if line.startswith(('#', '//', '/*', '"""', "'''", '*')):
+                            report.append(f"  > {line[:80]}")
                             break
-                        stripped = line.strip()
-                        if stripped and not stripped.startswith('#!'):
-                            first_lines.append(stripped)
-                    if first_lines:
-                        # Docstring veya yorum varsa göster
-                        for line in first_lines[:3]:
-                            if line.startswith(('#', '//', '/*', '"""', "'''", '*')):
-                                report.append(f"  > {line[:80]}")
-                                break
             except:
                 pass
         report.append("")
@@ -811,8 +1691,8 @@ def generate_folder_report(folder_path, root_path):
         report.append("")
         report.append("## 🖼️ Resim Dosyaları")
         report.append("")
-        for img in sorted(categories['image'], key=lambda x: x.name.lower()):
-            report.append(f"- 🖼️ `{img.name}` ({format_size(img.stat().st_size)})")
+        for img in categories['image']:
+            report.append(f"- 🖼️ `{img.name}` ({format_size(img.size)})")
         report.append("")
     
     # Arşivler
@@ -821,8 +1701,8 @@ def generate_folder_report(folder_path, root_path):
         report.append("")
         report.append("## 📦 Arşiv Dosyaları")
         report.append("")
-        for arc in sorted(categories['archive'], key=lambda x: x.name.lower()):
-            report.append(f"- 📦 `{arc.name}` ({format_size(arc.stat().st_size)})")
+        for arc in categories['archive']:
+            report.append(f"- 📦 `{arc.name}` ({format_size(arc.size)})")
         report.append("")
     
     # Diğer
@@ -831,23 +1711,26 @@ def generate_folder_report(folder_path, root_path):
         report.append("")
         report.append("## 📄 Diğer Dosyalar")
         report.append("")
-        for other in sorted(categories['other'], key=lambda x: x.name.lower()):
-            report.append(f"- 📄 `{other.name}` ({format_size(other.stat().st_size)})")
+        for other in categories['other']:
+            report.append(f"- 📄 `{other.name}` ({format_size(other.size)})")
         report.append("")
     
-    return "\n".join(report)
+    if fp is None:
+        return "\n".join(report)
 
 
-def generate_master_report(root_path, folder_reports):
-    """Ana rapor dosyasını oluşturur."""
-    root = Path(root_path)
-    
+def generate_master_report(root_path, folder_reports, report_date=None):
+    """Ana rapor dosyasını oluşturur (`report_date` verilmezse o anki tarih yazılır).
+
+    `root_path` çözümlenmiş (resolve) mutlak yol olmalıdır, yeniden çözümlenmez.
+    `folder_reports` ((klasör yolu, rapor dosyası) listesi) yola göre sıralı verilmelidir.
+    """
     report = []
     report.append(f"# 🏗️ Proje Analiz Raporu")
     report.append(f"")
-    report.append(f"**Proje Kök Klasörü:** `{root.name}`  ")
-    report.append(f"**Tam Yol:** `{root.resolve()}`  ")
-    report.append(f"**Rapor Tarihi:** {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}  ")
+    report.append(f"**Proje Kök Klasörü:** `{os.path.basename(root_path)}`  ")
+    report.append(f"**Tam Yol:** `{root_path}`  ")
+    report.append(f"**Rapor Tarihi:** {report_date or _now_str()}  ")
     report.append(f"**Rapor Oluşturan:** Proje Klasör Analiz Scripti v1.0")
     report.append(f"")
     report.append("---")
@@ -857,24 +1740,18 @@ def generate_master_report(root_path, folder_reports):
     total_files = 0
     total_dirs = 0
     total_size = 0
-    file_type_stats = defaultdict(int)
-    
-    for dirpath, dirnames, filenames in os.walk(root_path):
-        # Yoksayılan klasörleri filtrele
-        dirnames[:] = [d for d in dirnames if d not in IGNORED_DIRS 
-                       and not d.startswith('.') and d != RAPOR_KLASOR_ADI]
-        total_dirs += len(dirnames)
-        for fname in filenames:
-            if not fname.startswith('.') and fname != RAPOR_DOSYA_ADI:
-                total_files += 1
-                fpath = os.path.join(dirpath, fname)
-                try:
-                    total_size += os.path.getsize(fpath)
-                except:
-                    pass
-                ext = Path(fname).suffix.lower()
-                if ext:
-                    file_type_stats[ext] += 1
+    file_type_stats = Counter()
+    
+    # walk_tree taramaları önbellekten gelir; boyutlar için ayrıca stat yapılmaz
+    for dirpath, subdirs, files in walk_tree(root_path):
+        total_dirs += len(subdirs)
+        total_files += len(files)
+        for f in files:
+            if f.size is not None:
+                total_size += f.size
+            ext = get_extension(f.name)
+            if ext:
+                file_type_stats[ext] += 1
     
     report.append("## 📊 Genel İstatistikler")
     report.append("")
@@ -892,13 +1769,8 @@ def generate_master_report(root_path, folder_reports):
         report.append("")
         report.append("| Uzantı | Sayı | Kategori |")
         report.append("|--------|------|----------|")
-        for ext, count in sorted(file_type_stats.items(), key=lambda x: -x[1]):
-            cat = "📊 Excel" if ext in EXCEL_EXTENSIONS | EXCEL_OLD_EXTENSIONS else \
-                  "📝 Word" if ext in WORD_EXTENSIONS else \
-                  "📕 PDF" if ext in PDF_EXTENSIONS else \
-                  "💻 Kod" if ext in CODE_EXTENSIONS else \
-                  "🖼️ Resim" if ext in IMAGE_EXTENSIONS else \
-                  "📦 Arşiv" if ext in ARCHIVE_EXTENSIONS else "📄 Diğer"
+        for ext, count in file_type_stats.most_common():
+            cat = _KATEGORI_ETIKETLERI[get_file_category(ext)]
             report.append(f"| `{ext}` | {count} | {cat} |")
         report.append("")
     
@@ -919,16 +1791,13 @@ def generate_master_report(root_path, folder_reports):
     report.append("| Klasör | Dosya Sayısı | Rapor |")
     report.append("|--------|-------------|-------|")
     
-    for folder_path, report_filename in sorted(folder_reports, key=lambda x: x[0]):
-        folder = Path(folder_path)
-        try:
-            relative = folder.relative_to(root)
-        except:
-            relative = folder
+    for folder_path, report_filename in folder_reports:
+        relative = relative_path(folder_path, root_path)
         
-        file_count = sum(1 for f in folder.iterdir() if f.is_file() 
-                        and not f.name.startswith('.') and f.name != RAPOR_DOSYA_ADI) \
-                    if folder.exists() else 0
+        try:
+            file_count = len(scan_folder(folder_path)[1])
+        except OSError:
+            file_count = 0
         
         report.append(f"| 📁 `{relative}` | {file_count} | [{report_filename}]({report_filename}) |")
     
@@ -946,8 +1815,25 @@ def generate_master_report(root_path, folder_reports):
 # ═══════════════════════════════════════════════════════════════════════════════
 # ANA İŞLEM
 # ═══════════════════════════════════════════════════════════════════════════════
-def run_analysis(target_path):
-    """Ana analiz işlemini çalıştırır."""
+def _link_or_copy(src, dst):
+    """`dst`'yi `src`'ye sabit bağlantı (hardlink) olarak oluşturur; olmazsa kopyalar."""
+    try:
+        os.remove(dst)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def run_analysis(target_path, threads=False, deep=False, full=False):
+    """Ana analiz işlemini çalıştırır.
+
+    Dosya analizleri `create_executor` ile oluşturulan havuzda paralel yapılır.
+    `deep` True ise büyük Excel ve PDF dosyaları da tam modda analiz edilir; `full` True ise
+    boyut sınırını aşan dosyalar da atlanmaz.
+    """
     root = Path(target_path).resolve()
     
     if not root.exists():
@@ -963,16 +1849,21 @@ def run_analysis(target_path):
     print(f"║       🔍 Proje Klasör Analiz Scripti v1.0          ║")
     print(f"╚══════════════════════════════════════════════════════╝")
     print(f"")
+    # Tüm raporlar aynı başlangıç zamanıyla tarihlenir
+    started_str = _now_str()
+    
     print(f"📁 Hedef: {root}")
-    print(f"📅 Tarih: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"📅 Tarih: {started_str}")
     print(f"")
     
     # Kütüphane durumu
     print("📦 Kütüphane Durumu:")
     print(f"   {'✅' if HAS_OPENPYXL else '❌'} openpyxl (Excel .xlsx)")
     print(f"   {'✅' if HAS_XLRD else '❌'} xlrd (Excel .xls)")
+    print(f"   {'✅' if HAS_CALAMINE else '➖'} python-calamine (hızlı Excel okuma, opsiyonel)")
     print(f"   {'✅' if HAS_DOCX else '❌'} python-docx (Word)")
     print(f"   {'✅' if HAS_PDF else '❌'} pdfplumber (PDF)")
+    print(f"   {'✅' if HAS_FITZ else '➖'} PyMuPDF (hızlı PDF okuma, opsiyonel)")
     
     missing = []
     if not HAS_OPENPYXL: missing.append('openpyxl')
@@ -991,92 +1882,93 @@ def run_analysis(target_path):
     report_dir = root / RAPOR_KLASOR_ADI
     report_dir.mkdir(exist_ok=True)
     
-    # Tüm klasörleri tara
-    folders_to_analyze = []
-    for dirpath, dirnames, filenames in os.walk(str(root)):
-        # Yoksayılan klasörleri filtrele
-        dirnames[:] = [d for d in dirnames if d not in IGNORED_DIRS 
-                       and not d.startswith('.') and d != RAPOR_KLASOR_ADI]
-        
-        # Dosya var mı kontrol et (rapor dosyaları hariç)
-        real_files = [f for f in filenames if not f.startswith('.') and f != RAPOR_DOSYA_ADI]
-        if real_files or dirpath == str(root):
-            folders_to_analyze.append(dirpath)
-    
-    print(f"📂 {len(folders_to_analyze)} klasör analiz edilecek.\n")
+    # Döngülerde Path nesneleri yerine düz yollar kullanılır
+    root_str = str(root)
+    report_dir_str = str(report_dir)
     
     folder_reports = []
-    
-    for i, folder_path in enumerate(folders_to_analyze):
-        folder = Path(folder_path)
-        try:
-            relative = folder.relative_to(root)
-        except:
-            relative = folder
-        
-        print(f"  [{i+1}/{len(folders_to_analyze)}] 📁 {relative or '.'} ...", end=" ", flush=True)
-        
-        # Klasör raporu oluştur
-        report_content = generate_folder_report(folder_path, str(root))
-        
-        # Raporu klasörün içine kaydet
-        local_report_path = folder / RAPOR_DOSYA_ADI
-        try:
-            with open(local_report_path, 'w', encoding='utf-8') as f:
-                f.write(report_content)
-        except Exception as e:
-            print(f"⚠️ Yerel rapor yazılamadı: {e}")
-        
-        # Raporu ana rapor klasörüne de kaydet
-        if str(relative) == '.':
-            report_filename = "KOK_KLASOR_RAPORU.md"
-        else:
-            report_filename = str(relative).replace(os.sep, '_').replace('/', '_') + "_RAPORU.md"
-        
-        master_report_path = report_dir / report_filename
-        try:
-            with open(master_report_path, 'w', encoding='utf-8') as f:
-                f.write(report_content)
-        except Exception as e:
-            print(f"⚠️ Ana rapor yazılamadı: {e}")
+    executor = create_executor(threads)
+    folder_categories = {}
+    pending = {}
+    try:
+        # Tüm klasörleri tek geçişte tara ve kategorilere ayır (sonuçlar önbellekte kalır,
+        # raporlar yeniden taramaz). Dosyası olmayan klasörler (kök hariç) havuza gönderilmeden
+        # burada elenir; gizli dosyalar ve rapor dosyaları walk_tree çıktısında zaten yoktur.
+        # Her klasörün dosya analizleri klasör bulunur bulunmaz havuza gönderilir; böylece
+        # işçiler belgeleri ayrıştırırken tarama kalan klasörlerle devam eder
+        for dirpath, subdirs, files in walk_tree(root_str):
+            if files or dirpath == root_str:
+                folder_categories[dirpath] = categorize_files(dirpath, files)
+                pending[dirpath] = submit_analyses(executor, folder_categories[dirpath], deep, full)
+        folders_to_analyze = list(folder_categories)
         
-        folder_reports.append((folder_path, report_filename))
+        print(f"📂 {len(folders_to_analyze)} klasör analiz edilecek.\n")
         
-        # Analiz edilen dosya sayısı
-        categories = categorize_files(folder_path)
-        analyzed = len(categories['excel']) + len(categories['word']) + len(categories['pdf'])
-        total = sum(len(v) for v in categories.values())
-        print(f"✅ ({total} dosya, {analyzed} analiz edildi)")
+        for i, folder_path in enumerate(folders_to_analyze):
+            relative = relative_path(folder_path, root_str)
+            
+            print(f"  [{i+1}/{len(folders_to_analyze)}] 📁 {relative} ...", end=" ", flush=True)
+            
+            if relative == '.':
+                report_filename = "KOK_KLASOR_RAPORU.md"
+            else:
+                report_filename = relative.replace(os.sep, '_').replace('/', '_') + "_RAPORU.md"
+            
+            # Klasör raporunu bellekte birleştirmeden doğrudan ana rapor klasörüne yaz
+            master_report_path = os.path.join(report_dir_str, report_filename)
+            try:
+                with open(master_report_path, 'w', encoding='utf-8', buffering=RAPOR_YAZMA_TAMPONU) as f:
+                    generate_folder_report(folder_path, root_str, folder_categories[folder_path],
+                                           analyses=collect_analyses(pending.pop(folder_path)),
+                                           deep=deep, full=full, fp=f, report_date=started_str)
+            except OSError as e:
+                print(f"⚠️ Ana rapor yazılamadı: {e}")
+            
+            # Aynı raporu klasörün içine bağla (farklı dosya sistemindeyse kopyala)
+            local_report_path = os.path.join(folder_path, RAPOR_DOSYA_ADI)
+            try:
+                _link_or_copy(master_report_path, local_report_path)
+            except Exception as e:
+                print(f"⚠️ Yerel rapor yazılamadı: {e}")
+            
+            folder_reports.append((folder_path, report_filename))
+            
+            # Analiz edilen dosya sayısı
+            categories = folder_categories[folder_path]
+            analyzed = len(categories['excel']) + len(categories['word']) + len(categories['pdf'])
+            total = sum(len(v) for v in categories.values())
+            print(f"✅ ({total} dosya, {analyzed} analiz edildi)")
+    finally:
+        # Hata olursa kuyrukta bekleyen analizler başlatılmadan iptal edilir
+        for futures in pending.values():
+            for future in futures.values():
+                future.cancel()
+        executor.shutdown()
     
     # Ana rapor oluştur
     print(f"\n{'─' * 55}")
     print(f"📝 Ana rapor oluşturuluyor...")
     
-    master_content = generate_master_report(str(root), folder_reports)
-    
-    # Her klasör raporunun içeriğini ana rapora ekle
-    for folder_path, report_filename in sorted(folder_reports, key=lambda x: x[0]):
-        folder = Path(folder_path)
-        try:
-            relative = folder.relative_to(root)
-        except:
-            relative = folder
-        
-        master_report_file = report_dir / report_filename
-        if master_report_file.exists():
-            with open(master_report_file, 'r', encoding='utf-8') as f:
-                folder_content = f.read()
-            master_content += f"\n---\n\n{folder_content}\n"
+    # Klasör raporları bir kez sıralanır; tablo ve içerik aynı sırayı kullanır
+    folder_reports.sort(key=lambda x: x[0])
     
-    # Ana raporu kaydet
+    # Ana rapor: özet bölümü + her klasör raporu, bellekte birleştirilmeden dosyaya akıtılır
     master_report_path = report_dir / "ANA_RAPOR.md"
-    with open(master_report_path, 'w', encoding='utf-8') as f:
-        f.write(master_content)
-    
-    # Ayrıca kök dizine bir özet rapor koy
+    with open(master_report_path, 'w', encoding='utf-8', buffering=RAPOR_YAZMA_TAMPONU) as out:
+        out.write(generate_master_report(root_str, folder_reports, started_str))
+        for folder_path, report_filename in folder_reports:
+            try:
+                folder_file = open(os.path.join(report_dir_str, report_filename), 'r', encoding='utf-8')
+            except OSError:
+                continue
+            with folder_file:
+                out.write("\n---\n\n")
+                shutil.copyfileobj(folder_file, out, RAPOR_YAZMA_TAMPONU)
+                out.write("\n")
+    
+    # Ayrıca kök dizine ana raporu bağla (farklı dosya sistemindeyse kopyala)
     root_summary_path = root / "PROJE_ANALIZ_RAPORU.md"
-    with open(root_summary_path, 'w', encoding='utf-8') as f:
-        f.write(master_content)
+    _link_or_copy(master_report_path, root_summary_path)
     
     print(f"")
     print(f"╔══════════════════════════════════════════════════════╗")
@@ -1092,6 +1984,8 @@ def run_analysis(target_path):
     print(f"   📁 Rapor Klasörü:    {report_dir}/")
     print(f"   📄 Klasör Raporları: Her klasörde '{RAPOR_DOSYA_ADI}'")
     print(f"")
+    
+    clear_scan_cache()
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -1123,7 +2017,28 @@ Bu script şunları yapar:
         help="Analiz edilecek klasör yolu (varsayılan: mevcut dizin)"
     )
     
+    parser.add_argument(
+        "--threads",
+        action="store_true",
+        help="Dosya analizlerinde süreç yerine iş parçacığı havuzu kullan "
+             "(işçi sayısı DOSYA_WORKERS ile ayarlanır)"
+    )
+    
+    parser.add_argument(
+        "--deep",
+        action="store_true",
+        help="5 MB ve üzeri Excel dosyalarını da tam modda analiz et "
+             "(birleştirilmiş hücreler, tablolar, veri doğrulama, grafikler, yorumlar); "
+             "PyMuPDF yokken 20 ve üzeri sayfalı PDF'lerin sayfa detaylarını da çıkar"
+    )
+    
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help=f"{ANALIZ_BOYUT_SINIRI // (1024 * 1024)} MB üzerindeki Excel/Word/PDF dosyalarını da analiz et"
+    )
+    
     args = parser.parse_args()
     target = os.path.abspath(args.hedef)
     
-    run_analysis(target)
+    run_analysis(target, threads=args.threads, deep=args.deep, full=args.full)
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""Flask uygulaması (app) testleri."""
+
+import json
+import os
+import time
+import zipfile
+
+import pytest
+
+import app as web
+
+
+@pytest.fixture
+def client():
+    return web.app.test_client()
+
+
+# ─── İstek boyutu sınırı ──────────────────────────────────────────────────────
+def _ic_uygulama(environ, start_response):
+    start_response('200 OK', [('Content-Type', 'text/plain')])
+    return [b'ok']
+
+
+def _cagir(wsgi_app, content_length):
+    environ = {'REQUEST_METHOD': 'POST', 'PATH_INFO': '/upload'}
+    if content_length is not None:
+        environ['CONTENT_LENGTH'] = content_length
+    status = []
+    body = b''.join(wsgi_app(environ, lambda s, headers: status.append((s, dict(headers)))))
+    return status[0][0], status[0][1], body
+
+
+def test_content_length_limit_rejects_without_reading_body():
+    limited = web.ContentLengthLimit(_ic_uygulama, 100)
+    status, headers, body = _cagir(limited, '101')
+    assert status.startswith('413')
+    assert headers['Content-Type'] == 'application/json'
+    assert headers['Content-Length'] == str(len(body))
+    assert 'error' in json.loads(body)
+
+
+@pytest.mark.parametrize('content_length', ['100', '0', '', 'abc', None])
+def test_content_length_limit_passes_through(content_length):
+    limited = web.ContentLengthLimit(_ic_uygulama, 100)
+    status, _, body = _cagir(limited, content_length)
+    assert status == '200 OK'
+    assert body == b'ok'
+
+
+def test_content_length_limit_installed(client):
+    assert isinstance(web.app.wsgi_app, web.ContentLengthLimit)
+    too_large = str(web.app.config['MAX_CONTENT_LENGTH'] + 1)
+    response = client.post('/upload', environ_overrides={'CONTENT_LENGTH': too_large})
+    assert response.status_code == 413
+    assert 'error' in response.get_json()
+
+
+# ─── ZIP boyut kontrolü ───────────────────────────────────────────────────────
+def _zip(path, members):
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return zipfile.ZipFile(path)
+
+
+def test_check_zip_budget_accepts_normal_zip(tmp_path):
+    with _zip(tmp_path / 'ok.zip', {'a.txt': b'merhaba', 'alt/b.txt': os.urandom(2 * web.UPLOAD_CHUNK_SIZE)}) as zf:
+        assert web.check_zip_budget(zf, str(tmp_path / 'cikti')) is None
+
+
+def test_check_zip_budget_rejects_high_ratio(tmp_path):
+    # 16 MiB sıfır birkaç KB'a sıkışır (oran > ZIP_MAX_SIKISTIRMA_ORANI)
+    with _zip(tmp_path / 'bomba.zip', {'sifir.bin': bytes(16 * web.UPLOAD_CHUNK_SIZE)}) as zf:
+        error = web.check_zip_budget(zf, str(tmp_path / 'cikti'))
+    assert error and 'sifir.bin' in error
+
+
+def test_check_zip_budget_small_members_may_compress_well(tmp_path):
+    # Blok boyutunun altındaki üyeler oran denetimine girmez
+    with _zip(tmp_path / 'kucuk.zip', {'sifir.bin': bytes(web.UPLOAD_CHUNK_SIZE)}) as zf:
+        assert web.check_zip_budget(zf, str(tmp_path / 'cikti')) is None
+
+
+def test_check_zip_budget_rejects_total_size(tmp_path, monkeypatch):
+    monkeypatch.setattr(web, 'ZIP_MAX_ACIK_BOYUT', 1000)
+    with _zip(tmp_path / 'buyuk.zip', {'a.txt': b'x' * 600, 'b.txt': b'y' * 600}) as zf:
+        error = web.check_zip_budget(zf, str(tmp_path / 'cikti'))
+    assert error and 'çok büyük' in error
+
+
+def test_upload_folder_rejects_zip_bomb(client, tmp_path):
+    path = tmp_path / 'bomba.zip'
+    _zip(path, {'proje/sifir.bin': bytes(16 * web.UPLOAD_CHUNK_SIZE)}).close()
+    with open(path, 'rb') as f:
+        response = client.post('/upload-folder', data={'folder': (f, 'bomba.zip')},
+                               content_type='multipart/form-data')
+    assert response.status_code == 413
+    assert 'sıkıştırma oranı' in response.get_json()['error']
+
+
+# ─── Rapor indirme ────────────────────────────────────────────────────────────
+@pytest.fixture
+def rapor(client):
+    client.get('/library-status')  # İlk istek depolamayı hazırlar (init_storage)
+    result = {'filename': 'veri.xlsx', 'size': '1.0 KB', 'type': '.xlsx', 'analysis': '  - **Sayfa Sayısı:** 1'}
+    return web.save_report(result)
+
+
+def test_download_report(client, rapor):
+    response = client.get(f'/download/{rapor}')
+    assert response.status_code == 200
+    assert response.mimetype == 'text/markdown'
+    assert 'veri.xlsx_analizi.md' in response.headers['Content-Disposition']
+    assert response.get_data(as_text=True) == (
+        "# veri.xlsx Analizi\n\n- **Boyut:** 1.0 KB\n- **Tür:** .xlsx\n\n  - **Sayfa Sayısı:** 1")
+    assert response.headers['ETag'] and response.headers['Last-Modified']
+
+
+def test_download_report_conditional(client, rapor):
+    etag = client.get(f'/download/{rapor}').headers['ETag']
+    response = client.get(f'/download/{rapor}', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.get_data() == b''
+
+
+def test_download_report_missing(client, rapor):
+    response = client.get(f'/download/{"0" * 32}')
+    assert response.status_code == 404
+    assert 'error' in response.get_json()
+
+    # Kimlik biçimi dışındaki yollar dosya sistemine ulaşmaz
+    assert client.get('/download/..').status_code in (400, 404)
+    assert client.get('/download/abc').status_code == 400
+
+
+def test_download_report_expired(client, rapor):
+    report_dir = os.path.join(web.RAPOR_ARSIVI, rapor)
+    old = time.time() - web.RAPOR_OMRU_SANIYE - 1
+    os.utime(report_dir, (old, old))
+    web._prune_reports()
+    assert client.get(f'/download/{rapor}').status_code == 404
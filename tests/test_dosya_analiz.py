@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""dosya_analiz modülü testleri."""
+
+import os
+import signal
+import time
+
+import pytest
+
+import dosya_analiz as da
+
+
+# ─── Analiz önbelleği ─────────────────────────────────────────────────────────
+@pytest.fixture
+def onbellek(tmp_path, monkeypatch):
+    """Önbelleği geçici bir veritabanına yönlendirir."""
+    path = str(tmp_path / 'cache.sqlite3')
+    monkeypatch.setattr(da, 'ONBELLEK_DOSYASI', path)
+    return path
+
+
+@pytest.fixture
+def sayac_analizci():
+    """Her gerçek çağrıyı sayan, önbellekli sahte bir analizci döndürür."""
+    calls = []
+
+    @da.cached_analyzer
+    def analyze_sahte(filepath, deep=False):
+        calls.append((filepath, deep))
+        return f"sonuç {len(calls)}"
+
+    return analyze_sahte, calls
+
+
+def test_cached_analyzer_hit(tmp_path, onbellek, sayac_analizci):
+    analyzer, calls = sayac_analizci
+    path = tmp_path / 'a.xlsx'
+    path.write_bytes(b'veri')
+
+    assert analyzer(str(path)) == "sonuç 1"
+    assert analyzer(str(path)) == "sonuç 1"
+    # Varsayılan değerler anahtara girer: açıkça verilen deep=False aynı kayıttır
+    assert analyzer(str(path), deep=False) == "sonuç 1"
+    assert len(calls) == 1
+
+    # Farklı parametre ayrı kayıttır
+    assert analyzer(str(path), deep=True) == "sonuç 2"
+    assert len(calls) == 2
+
+
+def test_cached_analyzer_invalidated_on_change(tmp_path, onbellek, sayac_analizci):
+    analyzer, calls = sayac_analizci
+    path = tmp_path / 'a.xlsx'
+    path.write_bytes(b'veri')
+    assert analyzer(str(path)) == "sonuç 1"
+
+    # Aynı boyut, farklı değişiklik zamanı
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert analyzer(str(path)) == "sonuç 2"
+
+    # Farklı boyut
+    path.write_bytes(b'daha uzun veri')
+    assert analyzer(str(path)) == "sonuç 3"
+    assert analyzer(str(path)) == "sonuç 3"
+    assert len(calls) == 3
+
+
+def test_cached_analyzer_skips_errors(tmp_path, onbellek):
+    calls = []
+
+    @da.cached_analyzer
+    def analyze_hatali(filepath):
+        calls.append(filepath)
+        return "  > ❌ Dosya açılamadı: kilitli"
+
+    path = tmp_path / 'a.docx'
+    path.write_bytes(b'veri')
+    analyze_hatali(str(path))
+    analyze_hatali(str(path))
+    assert len(calls) == 2
+
+
+def test_cached_analyzer_out_and_disabled(tmp_path, onbellek, sayac_analizci):
+    analyzer, calls = sayac_analizci
+    path = tmp_path / 'a.pdf'
+    path.write_bytes(b'veri')
+
+    # cache=False veritabanını hiç açmaz
+    assert analyzer(str(path), cache=False) == "sonuç 1"
+    assert not os.path.exists(onbellek)
+
+    out = ["başlık"]
+    assert analyzer(str(path), out=out) is None
+    assert out == ["başlık", "sonuç 2"]
+    assert analyzer(str(path)) == "sonuç 2"
+    assert len(calls) == 2
+
+
+def test_clear_analysis_cache(tmp_path, onbellek, sayac_analizci):
+    analyzer, calls = sayac_analizci
+    path = tmp_path / 'a.xlsx'
+    path.write_bytes(b'veri')
+    analyzer(str(path))
+
+    assert da.clear_analysis_cache() == 1
+    analyzer(str(path))
+    assert len(calls) == 2
+
+
+# ─── Analiz süre sınırı ───────────────────────────────────────────────────────
+posix_only = pytest.mark.skipif(not hasattr(signal, 'setitimer'), reason="SIGALRM yalnızca POSIX'te")
+
+
+def _bekle(seconds):
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        pass
+
+
+@posix_only
+def test_deadline_expires():
+    start = time.monotonic()
+    with pytest.raises(da._AnalizZamanAsimi):
+        with da._deadline(0.2):
+            _bekle(5)
+    assert time.monotonic() - start < 2
+    # Zamanlayıcı kapatılır ve önceki işleyici geri yüklenir
+    assert signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
+    assert signal.getsignal(signal.SIGALRM) is signal.SIG_DFL
+
+
+@posix_only
+def test_deadline_fires_once():
+    # Yutulan zaman aşımı yeniden fırlatılmaz; blok sonrası işçi temiz kalır
+    with da._deadline(0.1):
+        try:
+            _bekle(1)
+        except da._AnalizZamanAsimi:
+            pass
+        _bekle(1.2)  # Eski tekrarlı zamanlayıcı (1 sn) burada yeniden tetiklenirdi
+    assert signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
+
+
+@posix_only
+def test_deadline_not_reached():
+    with da._deadline(5):
+        pass
+    assert signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
+
+
+@posix_only
+def test_analyze_one_timeout(tmp_path, monkeypatch):
+    def analyze_yavas(filepath):
+        _bekle(5)
+        return "bitmemeli"
+
+    monkeypatch.setitem(da._ANALYZERS, 'excel', (analyze_yavas, 'Excel'))
+    monkeypatch.setattr(da, 'ANALIZ_ZAMAN_ASIMI', 0.2)
+    path = tmp_path / 'a.xlsx'
+    path.write_bytes(b'veri')
+    assert da.analyze_one('excel', str(path)) == (str(path), da._ZAMAN_ASIMI_NOTU)
+
+
+def test_analyze_one_size_gate_and_errors(tmp_path, monkeypatch):
+    def analyze_hatali(filepath):
+        raise ValueError("bozuk")
+
+    monkeypatch.setitem(da._ANALYZERS, 'pdf', (analyze_hatali, 'PDF'))
+    path = tmp_path / 'a.pdf'
+    path.write_bytes(b'veri')
+    assert da.analyze_one('pdf', str(path))[1] == "  > ❌ PDF analiz hatası: bozuk"
+    assert "Atlandı" in da.analyze_one('pdf', str(path), size=da.ANALIZ_BOYUT_SINIRI + 1)[1]